@@ -1,13 +1,50 @@
 # === build.py (Steam-ready, fully self-cleaning version) ===
-import json
+import glob
 import os
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from core.utils import json_loads
+
+# Kernel-side file copy on Windows (no user-mode read/write loop)
+try:
+    import ctypes
+    from ctypes import wintypes
+
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _CopyFileW = _kernel32.CopyFileW
+    _CopyFileW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.BOOL]
+    _CopyFileW.restype = wintypes.BOOL
+except (AttributeError, OSError, ValueError):  # ValueError: wintypes off Windows
+    _kernel32 = None
+    _CopyFileW = None
+
+# CopyFile2 (Windows 8+) can bypass the cache manager for big files
+COPY_FILE_NO_BUFFERING = 0x00001000
+NO_BUFFERING_MIN_SIZE = 1 << 20  # 1 MB; smaller files copy faster through the cache
+
+try:
+    class COPYFILE2_EXTENDED_PARAMETERS(ctypes.Structure):
+        _fields_ = [
+            ("dwSize", wintypes.DWORD),
+            ("dwCopyFlags", wintypes.DWORD),
+            ("pfCancel", ctypes.POINTER(wintypes.BOOL)),
+            ("pProgressRoutine", ctypes.c_void_p),
+            ("pvCallbackContext", ctypes.c_void_p),
+        ]
+
+    _CopyFile2 = _kernel32.CopyFile2
+    _CopyFile2.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR,
+                           ctypes.POINTER(COPYFILE2_EXTENDED_PARAMETERS)]
+    _CopyFile2.restype = ctypes.c_long  # HRESULT
+except (AttributeError, NameError):
+    _CopyFile2 = None
 
 # ----------------- Load config -----------------
-with open("app_settings.json", "r", encoding="utf-8") as f:
-    cfg = json.load(f)
+with open("app_settings.json", "rb") as f:
+    cfg = json_loads(f.read())
 
 EXE_NAME = cfg["exe_name"]            # "AppLauncher"
 ICON_PATH = cfg["icon_path"]          # "resources/icons/AppLauncher.ico"
@@ -17,62 +54,129 @@ VERSION = cfg.get("version", "0.0.0")
 DIST_DIR = "dist"
 BUILD_DIR = "build"
 RELEASE_DIR = "release"
+SPEC_FILE = f"{EXE_NAME}.spec"
+
+# Anything that changes what PyInstaller would analyze or bake into the spec
+SPEC_INPUTS = ["main.py", "build.py", "app_settings.json", "core", "ui"]
 
 # ----------------- Command helpers -----------------
 def run(cmd):
     print(">", " ".join(cmd))
     subprocess.run(cmd, check=True)
 
+def _copy_unbuffered(src, dst):
+    """CopyFile2 with COPY_FILE_NO_BUFFERING; False if unavailable or it failed."""
+    if _CopyFile2 is None:
+        return False
+    params = COPYFILE2_EXTENDED_PARAMETERS(
+        dwSize=ctypes.sizeof(COPYFILE2_EXTENDED_PARAMETERS),
+        dwCopyFlags=COPY_FILE_NO_BUFFERING,
+    )
+    return _CopyFile2(src, dst, ctypes.byref(params)) >= 0  # SUCCEEDED(hr)
+
+def fast_copy(src, dst):
+    """Copy a file via CopyFile2/CopyFileW when available, else shutil.copy. Returns dst."""
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    if os.path.getsize(src) > NO_BUFFERING_MIN_SIZE and _copy_unbuffered(src, dst):
+        return dst
+    if _CopyFileW is None or not _CopyFileW(src, dst, False):
+        shutil.copy(src, dst)
+    return dst
+
+def parallel_copytree(src, dst):
+    """Copy a directory tree; directories serially, files on a thread pool."""
+    jobs = []
+    for root, _dirs, files in os.walk(src):
+        target = os.path.join(dst, os.path.relpath(root, src))
+        os.makedirs(target, exist_ok=True)
+        jobs.extend((os.path.join(root, f), os.path.join(target, f)) for f in files)
+
+    # Many small icons: per-file open/close latency dominates, and threads
+    # release the GIL inside the copy syscalls
+    workers = min(32, (os.cpu_count() or 1) * 2)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for _ in pool.map(lambda job: fast_copy(*job), jobs):
+            pass  # drain, re-raising the first copy error
+
 def ensure_dir(path):
     os.makedirs(path, exist_ok=True)
 
 def safe_rmtree(path):
-    if os.path.exists(path):
-        shutil.rmtree(path, ignore_errors=True)
+    # ignore_errors already covers a missing path; no separate exists() stat
+    shutil.rmtree(path, ignore_errors=True)
 
 def safe_remove(path):
-    if os.path.exists(path):
-        try:
-            os.remove(path)
-        except Exception:
-            pass
+    try:
+        os.remove(path)
+    except OSError:  # includes FileNotFoundError
+        pass
 
 # ----------------- Build process -----------------
-def build():
-    """Compile the PyQt app into a single .exe"""
+def _newest_mtime(paths):
+    """Latest mtime among the given files and the .py files under given dirs."""
+    newest = 0.0
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _dirs, files in os.walk(path):
+                for f in files:
+                    if f.endswith(".py"):
+                        newest = max(newest, os.path.getmtime(os.path.join(root, f)))
+        else:
+            try:
+                newest = max(newest, os.path.getmtime(path))
+            except FileNotFoundError:
+                pass
+    return newest
+
+def spec_is_current():
+    """True when the kept .spec is newer than every source it was generated from."""
+    try:
+        spec_mtime = os.path.getmtime(SPEC_FILE)
+    except FileNotFoundError:
+        return False
+    return spec_mtime >= _newest_mtime(SPEC_INPUTS)
+
+def build(fresh=False):
+    """Compile the PyQt app into a one-folder bundle (dist/<EXE_NAME>/)"""
     print(f"🚀 Building {EXE_NAME}.exe …")
 
-    # Clean temp dirs first for a fully fresh build
+    # Output folder is always rebuilt; build/ holds PyInstaller's incremental state
     safe_rmtree(DIST_DIR)
-    safe_rmtree(BUILD_DIR)
-
-    pyi_cmd = [
-        sys.executable, "-m", "PyInstaller",
-        "--onefile",
-        "--noconsole",
-        "--clean",
-        f"--icon={ICON_PATH}",
-        f"--add-data={INCLUDE_RES}",
-        "--add-data=app_settings.json;.",
-        f"--name={EXE_NAME}",
-        "main.py",
-    ]
+
+    if not fresh and spec_is_current():
+        # Sources unchanged since the spec was written: rebuild from it and
+        # let PyInstaller reuse the cached analysis in build/
+        print(f"♻️ Reusing {SPEC_FILE} (sources unchanged).")
+        pyi_cmd = [sys.executable, "-m", "PyInstaller", "--noconfirm", SPEC_FILE]
+    else:
+        # Full re-analysis; this also (re)writes the spec file
+        safe_rmtree(BUILD_DIR)
+        pyi_cmd = [
+            sys.executable, "-m", "PyInstaller",
+            "--onedir",  # no per-launch unpack to %TEMP%\_MEIxxxx
+            "--noconsole",
+            "--clean",
+            "--noconfirm",
+            f"--icon={ICON_PATH}",
+            f"--add-data={INCLUDE_RES}",
+            "--add-data=app_settings.json;.",
+            f"--name={EXE_NAME}",
+            "main.py",
+        ]
 
     run(pyi_cmd)
 
-    exe_src = os.path.join(DIST_DIR, f"{EXE_NAME}.exe")
+    exe_src = os.path.join(DIST_DIR, EXE_NAME, f"{EXE_NAME}.exe")
     if not os.path.exists(exe_src):
         raise FileNotFoundError(f"❌ Expected built exe not found: {exe_src}")
 
-    # Delete the automatically generated spec file — not needed
-    safe_remove(f"{EXE_NAME}.spec")
-
-    print("✅ PyInstaller build OK (spec file deleted).")
+    print("✅ PyInstaller build OK.")
 
 # ----------------- Optional: Code signing -----------------
 def sign_exe_if_available():
     """Optional: sign exe if signtool.exe exists (skips silently otherwise)."""
-    exe_path = os.path.join(DIST_DIR, f"{EXE_NAME}.exe")
+    exe_path = os.path.join(DIST_DIR, EXE_NAME, f"{EXE_NAME}.exe")
     signtool_path = r"C:\Program Files (x86)\Windows Kits\10\bin\10.0.26100.0\x64\signtool.exe"
     if not os.path.exists(signtool_path):
         print("ℹ️ signtool.exe not found — skipping code signing.")
@@ -102,20 +206,19 @@ def prepare_release():
     safe_rmtree(RELEASE_DIR)
     ensure_dir(RELEASE_DIR)
 
-    # Copy built exe
-    exe_src = os.path.join(DIST_DIR, f"{EXE_NAME}.exe")
-    shutil.copy(exe_src, os.path.join(RELEASE_DIR, f"{EXE_NAME}.exe"))
+    # Copy the built bundle (exe + its _internal folder)
+    parallel_copytree(os.path.join(DIST_DIR, EXE_NAME), RELEASE_DIR)
 
     # Copy necessary top-level files
     for fname in ["app_settings.json", "LICENSE", "README.md"]:
         if os.path.exists(fname):
-            shutil.copy(fname, os.path.join(RELEASE_DIR, fname))
+            fast_copy(fname, os.path.join(RELEASE_DIR, fname))
         else:
             print(f"⚠️ {fname} not found — skipping.")
 
     # Copy resources (icons, etc.)
     if os.path.exists("resources"):
-        shutil.copytree("resources", os.path.join(RELEASE_DIR, "resources"), dirs_exist_ok=True)
+        parallel_copytree("resources", os.path.join(RELEASE_DIR, "resources"))
     else:
         print("⚠️ resources/ folder missing — UI icons will not load.")
 
@@ -127,15 +230,15 @@ def prepare_release():
 
 # ----------------- Cleanup extras -----------------
 def cleanup_misc():
-    """Delete unnecessary leftovers and duplicate .spec files."""
-    print("🧹 Cleaning up unnecessary files …")
+    """Delete unnecessary leftovers and duplicate .spec files.
 
-    # Delete PyInstaller temp build dirs
-    safe_rmtree(BUILD_DIR)
+    build/ and <EXE_NAME>.spec are kept so the next build can skip re-analysis.
+    """
+    print("🧹 Cleaning up unnecessary files …")
 
-    # Delete any remaining .spec files
-    for file in os.listdir("."):
-        if file.endswith(".spec"):
+    # Delete any stray .spec files (not the one reused by build())
+    for file in glob.glob("*.spec"):
+        if file != SPEC_FILE:
             safe_remove(file)
             print(f"   🗑 Deleted {file}")
 
@@ -143,7 +246,8 @@ def cleanup_misc():
 
 # ----------------- Entry point -----------------
 if __name__ == "__main__":
-    build()
+    # python build.py --fresh  → ignore the kept spec and re-analyze everything
+    build(fresh="--fresh" in sys.argv[1:])
     sign_exe_if_available()
     prepare_release()
     cleanup_misc()
@@ -1,11 +1,14 @@
 # core/app_settings.py
-import json
 import os
 import sys
+from functools import cache, lru_cache
 
+from core.utils import json_loads
 
+
+@cache
 def get_base_dir() -> str:
-    """Return correct base directory for both source and PyInstaller build."""
+    """Return correct base directory for both source and PyInstaller build (computed once)."""
     if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
         # Running from PyInstaller bundle
         return sys._MEIPASS
@@ -14,10 +17,15 @@ def get_base_dir() -> str:
 
 def load_settings() -> dict:
     base_dir = get_base_dir()
-    path = os.path.join(base_dir, "app_settings.json")
-    if not os.path.exists(path):
-        raise FileNotFoundError(f"Missing app_settings.json at: {path}")
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _load(os.path.join(base_dir, "app_settings.json"))
+
+@lru_cache(maxsize=None)
+def _load(path: str) -> dict:
+    """Parse app_settings.json once per path; it is read-only at runtime."""
+    try:
+        with open(path, "rb") as f:
+            return json_loads(f.read())
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Missing app_settings.json at: {path}") from None
 
 APP_SETTINGS = load_settings()
\ No newline at end of file
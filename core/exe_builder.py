@@ -1,13 +1,27 @@
-import json
 import os
+import shutil
 import subprocess
+import tempfile
+from functools import lru_cache
 
 from PyQt6.QtCore import QStandardPaths
 
+from core.utils import json_dumps
+
+
+@lru_cache(maxsize=None)
+def _writable_location(location: QStandardPaths.StandardLocation) -> str:
+    """QStandardPaths.writableLocation, resolved once per location."""
+    return QStandardPaths.writableLocation(location)
+
 
 def build_single_launcher(name: str, bundle: dict):
-    """Builds a standalone .exe launcher for a single App Launch entry."""
-    base_dir = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation)
+    """Builds a standalone .exe launcher for a single App Launch entry.
+
+    PyInstaller's build, dist, spec and cache folders all live in a fresh temp
+    dir, removed afterwards whether the build succeeded or not.
+    """
+    base_dir = _writable_location(QStandardPaths.StandardLocation.AppDataLocation)
     custom_dir = os.path.join(base_dir, "custom_launchers")
     os.makedirs(custom_dir, exist_ok=True)
 
@@ -15,6 +29,8 @@ def build_single_launcher(name: str, bundle: dict):
     script_path = os.path.join(custom_dir, f"{name}_runner.py")
     script_content = f'''import asyncio, subprocess, os, win32con, win32process
 
+CREATE_NO_WINDOW = 0x08000000
+
 async def launch_app(path: str, delay: float, start_option: str):
     path = path.strip().strip('"').strip("'")
     si = subprocess.STARTUPINFO()
@@ -29,8 +45,9 @@ async def launch_app(path: str, delay: float, start_option: str):
 
     creation_flags = win32process.DETACHED_PROCESS if start_option == "Minimized" else 0
 
-    if path.lower().endswith(".bat"):
-        subprocess.Popen(["cmd.exe", "/c", path], startupinfo=si, creationflags=creation_flags)
+    if path.lower().endswith((".bat", ".cmd")):
+        # No console host for batch files, same as the main app
+        subprocess.Popen(["cmd.exe", "/c", path], startupinfo=si, creationflags=CREATE_NO_WINDOW)
     else:
         subprocess.Popen([path], startupinfo=si, creationflags=creation_flags)
 
@@ -46,7 +63,7 @@ async def run_launch_sequence(apps):
             await asyncio.sleep(app["delay"])
     print("✅ Done.")
 
-bundle = {json.dumps(bundle, indent=2)}
+bundle = {json_dumps(bundle).decode("utf-8")}
 asyncio.run(run_launch_sequence(bundle["paths"]))
 '''
 
@@ -55,51 +72,51 @@ asyncio.run(run_launch_sequence(bundle["paths"]))
 
     # Step 2: Build .exe with PyInstaller
     # ✅ Use QStandardPaths instead of winshell to find Desktop
-    desktop = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.DesktopLocation)
+    desktop = _writable_location(QStandardPaths.StandardLocation.DesktopLocation)
     if not desktop or not os.path.exists(desktop):
         desktop = os.path.join(os.path.expanduser("~"), "Desktop")
 
     exe_name = f"{name} Launcher"
     exe_path = os.path.join(desktop, exe_name + ".exe")
 
-    icon_path = os.path.join(os.path.dirname(__file__), "..", "resources", "icons", "AppLauncher.ico")
-
-    cmd = [
-        "pyinstaller",
-        "--onefile",
-        "--noconsole",
-        f"--icon={icon_path}",
-        f"--name={exe_name}",
-        script_path
-    ]
-    subprocess.run(cmd, shell=True, check=True)
-
-    # Step 3: Detect where PyInstaller output actually is
-    dist_dir = os.path.join(os.getcwd(), "dist")
-    exe_filename = f"{exe_name}.exe"
-
-    dist_exe = os.path.join(dist_dir, exe_filename)
-    if not os.path.exists(dist_exe):
-        alt_exe = os.path.join(dist_dir, exe_name, exe_filename)
-        if os.path.exists(alt_exe):
-            dist_exe = alt_exe
-        else:
-            raise FileNotFoundError(f"PyInstaller output not found in {dist_dir}")
-
-    # Step 4: Move result to Desktop
-    os.makedirs(desktop, exist_ok=True)
-    os.replace(dist_exe, exe_path)
-
-    # Step 5: Cleanup build artifacts
-    for folder in ("build", "dist", f"{exe_name}.spec"):
-        if os.path.exists(folder):
-            try:
-                if os.path.isdir(folder):
-                    import shutil
-                    shutil.rmtree(folder)
-                else:
-                    os.remove(folder)
-            except Exception:
-                pass
+    icon_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "resources", "icons", "AppLauncher.ico"))
+
+    work_dir = tempfile.mkdtemp(prefix="launcher_build_")
+    try:
+        dist_dir = os.path.join(work_dir, "dist")
+        env = {**os.environ, "PYINSTALLER_CONFIG_DIR": os.path.join(work_dir, "config")}
+
+        cmd = [
+            "pyinstaller",
+            "--onefile",
+            "--noconsole",
+            f"--icon={icon_path}",
+            f"--name={exe_name}",
+            f"--workpath={os.path.join(work_dir, 'build')}",
+            f"--distpath={dist_dir}",
+            f"--specpath={work_dir}",
+            script_path
+        ]
+        # Run pyinstaller directly (no cmd.exe in between) and without a console window
+        subprocess.run(cmd, check=True, env=env,
+                       creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0))
+
+        # Step 3: Detect where PyInstaller output actually is
+        exe_filename = f"{exe_name}.exe"
+
+        dist_exe = os.path.join(dist_dir, exe_filename)
+        if not os.path.exists(dist_exe):
+            alt_exe = os.path.join(dist_dir, exe_name, exe_filename)
+            if os.path.exists(alt_exe):
+                dist_exe = alt_exe
+            else:
+                raise FileNotFoundError(f"PyInstaller output not found in {dist_dir}")
+
+        # Step 4: Move result to Desktop (shutil.move: %TEMP% and Desktop may be on different drives)
+        os.makedirs(desktop, exist_ok=True)
+        shutil.move(dist_exe, exe_path)
+    finally:
+        # Step 5: Cleanup build artifacts (all of them live under work_dir)
+        shutil.rmtree(work_dir, ignore_errors=True)
 
     return exe_path
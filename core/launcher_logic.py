@@ -1,7 +1,10 @@
 import asyncio
+import atexit
 import datetime
+import math
 import os
 import subprocess
+from functools import lru_cache
 
 import win32con
 
@@ -13,87 +16,160 @@ except ImportError:
 
 from ui.theme_manager import ThemeManager
 
+# Windows process-creation flag: no console host (conhost.exe) for the child
+CREATE_NO_WINDOW = 0x08000000
+
+# start_option -> ShowWindow command (resolved once, not per launch)
+_SHOW = {
+    "Normal": win32con.SW_SHOWNORMAL,
+    "Maximized": win32con.SW_SHOWMAXIMIZED,
+    "Minimized": win32con.SW_SHOWMINNOACTIVE,
+}
+_STARTF = win32con.STARTF_USESHOWWINDOW
+
 
 # --- Debug Logging ---
+_LOG_MAX_BYTES = 1_000_000
+_LOG_CHECK_EVERY = 50  # size check cadence, in entries
+_log_fh = None
+_log_writes = 0
+_debug_enabled = None  # cached "debug_logging" setting, see refresh_log_config()
+
+
+def refresh_log_config():
+    """Re-read the debug_logging setting (once per run sequence, not per line)."""
+    global _debug_enabled
+    _debug_enabled = bool(ThemeManager.get_setting("debug_logging", True))
+
+
+def set_debug(enabled: bool):
+    """Switch logging on/off at runtime (Settings toggle), without a settings re-read."""
+    global _debug_enabled
+    _debug_enabled = bool(enabled)
+
+
+def _log_file():
+    """Open log.txt for appending once; the handle is closed at exit.
+
+    Line-buffered, so every entry reaches the file even if the app is killed.
+    """
+    global _log_fh, _log_writes
+    if _log_fh is None:
+        # Ensure app dir exists and resolve log path via ThemeManager
+        ThemeManager.ensure_appdir()
+        log_path = os.path.join(ThemeManager.APP_DIR, "log.txt")
+        _log_fh = open(log_path, "a", encoding="utf-8", buffering=1)
+        _log_writes = 0  # check the size on the first entry
+        atexit.register(_close_log)
+    return _log_fh
+
+
+def _close_log():
+    global _log_fh
+    if _log_fh is not None:
+        try:
+            _log_fh.close()
+        finally:
+            _log_fh = None
+
+
+def flush_log():
+    """Push buffered log entries to disk (end of a run sequence, exit)."""
+    if _log_fh is not None:
+        try:
+            _log_fh.flush()
+        except Exception:
+            pass
+
+
 def log(message: str, exc: Exception | None = None):
     """
     Append a detailed log entry to %APPDATA%/App Launcher/log.txt
-    Only runs when ThemeManager.get_setting('debug_logging', True) is True.
+    Only runs when the debug_logging setting is on (cached, see refresh_log_config).
     Truncates file when it grows beyond 1 MB.
     """
+    global _log_writes
     try:
-        if not ThemeManager.get_setting("debug_logging", True):
+        if _debug_enabled is None:
+            refresh_log_config()
+        if not _debug_enabled:
             return
 
-        # Ensure app dir exists and resolve log path via ThemeManager
-        ThemeManager.ensure_appdir()
-        log_dir = ThemeManager.APP_DIR
-        log_path = os.path.join(log_dir, "log.txt")
+        f = _log_file()
 
-        # Truncate if > 1MB
-        if os.path.exists(log_path) and os.path.getsize(log_path) > 1_000_000:
-            with open(log_path, "w", encoding="utf-8") as f:
-                f.write(f"[{datetime.datetime.now():%Y-%m-%d %H:%M:%S}] 🔄 Log truncated (>1MB)\n")
+        # Truncate if > 1MB (checked every few entries, not per line)
+        if _log_writes % _LOG_CHECK_EVERY == 0 and f.tell() > _LOG_MAX_BYTES:
+            f.seek(0)
+            f.truncate()
+            f.write(f"[{datetime.datetime.now():%Y-%m-%d %H:%M:%S}] 🔄 Log truncated (>1MB)\n")
+        _log_writes += 1
 
         # Append entry
         ts = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        with open(log_path, "a", encoding="utf-8") as f:
-            f.write(f"[{ts}] {message}\n")
-            if exc is not None:
-                f.write(f"    Exception: {exc.__class__.__name__}: {exc}\n")
+        f.write(f"[{ts}] {message}\n")
+        if exc is not None:
+            f.write(f"    Exception: {exc.__class__.__name__}: {exc}\n")
     except Exception:
         # Never allow logging to break the app
         pass
 
+# 🧩 CASE 1: .bat or .cmd (silent)
+def _run_batch(path: str, si):
+    # Run batch silently with CREATE_NO_WINDOW
+    subprocess.Popen(
+        ["cmd.exe", "/c", path],
+        creationflags=CREATE_NO_WINDOW,
+        startupinfo=si
+    )
+
+# 🧩 CASE 2: .exe or .lnk (apps and shortcuts)
+def _open_app(path: str, si):
+    shell.ShellExecuteEx(
+        fMask=shellcon.SEE_MASK_NO_CONSOLE,
+        lpVerb="open",
+        lpFile=path,
+        nShow=si.wShowWindow
+    )
+
+# 🧩 CASE 3: Any other file (folder, pdf, image, url, etc.)
+def _open_other(path: str, si):
+    # Use same ShellExecuteEx call to simulate Explorer double-click
+    shell.ShellExecuteEx(
+        fMask=shellcon.SEE_MASK_NO_CONSOLE,
+        lpVerb="open",
+        lpFile=path,
+        nShow=_SHOW["Normal"]
+    )
+
+# extension -> launcher; anything else goes through _open_other
+_HANDLERS = {
+    ".bat": _run_batch,
+    ".cmd": _run_batch,
+    ".exe": _open_app,
+    ".lnk": _open_app,
+}
+
+
+@lru_cache(maxsize=256)
+def _resolve_target(path: str):
+    """Normalized path + launch handler, worked out once per distinct path string."""
+    path = path.strip().strip('"').strip("'")
+    ext = os.path.splitext(path)[1].lower()
+    return path, _HANDLERS.get(ext, _open_other)
+
+
 async def launch_app(path: str, delay: float, start_option: str):
     """Launch any file as if double-clicked in Explorer, fully silent (no cmd window)."""
-    # --- Normalize path ---
-    path = path.strip().strip('"').strip("'")
+    # --- Normalize path (cached per raw path string) ---
+    path, handler = _resolve_target(path)
 
     si = subprocess.STARTUPINFO()
-    si.dwFlags |= win32con.STARTF_USESHOWWINDOW
-
-    if start_option == "Maximized":
-        si.wShowWindow = win32con.SW_SHOWMAXIMIZED
-    elif start_option == "Minimized":
-        si.wShowWindow = win32con.SW_SHOWMINNOACTIVE
-    else:
-        si.wShowWindow = win32con.SW_SHOWNORMAL
+    si.dwFlags = _STARTF
+    si.wShowWindow = _SHOW.get(start_option, _SHOW["Normal"])
 
     # --- Launch logic ---
     try:
-        ext = os.path.splitext(path)[1].lower()
-
-        # 🧩 CASE 1: .bat or .cmd (silent)
-        if ext in (".bat", ".cmd"):
-            # Run batch silently with CREATE_NO_WINDOW
-            CREATE_NO_WINDOW = 0x08000000
-            subprocess.Popen(
-                ["cmd.exe", "/c", path],
-                creationflags=CREATE_NO_WINDOW,
-                startupinfo=si
-            )
-
-
-        # 🧩 CASE 2: .exe or .lnk (apps and shortcuts)
-        elif ext in (".exe", ".lnk"):
-            shell.ShellExecuteEx(
-                fMask=shellcon.SEE_MASK_NO_CONSOLE,
-                lpVerb="open",
-                lpFile=path,
-                nShow=si.wShowWindow
-            )
-
-        # 🧩 CASE 3: Any other file (folder, pdf, image, url, etc.)
-        else:
-            # Use same ShellExecuteEx call to simulate Explorer double-click
-            shell.ShellExecuteEx(
-                fMask=shellcon.SEE_MASK_NO_CONSOLE,
-                lpVerb="open",
-                lpFile=path,
-                nShow=win32con.SW_SHOWNORMAL
-            )
-
+        handler(path, si)
         log(f"✅ Opened silently: {path}")
 
     except Exception as e:
@@ -101,9 +177,29 @@ async def launch_app(path: str, delay: float, start_option: str):
         raise
 
 
+async def _countdown(delay: float, progress_cb=None):
+    """Wait `delay` seconds in one sleep; the per-second ticks run as loop timers."""
+    def tick(remaining: int):
+        # overwrite same line (no newline)
+        progress_cb(f"⏳ Waiting {remaining:>2}s before next...", end="\r")
+
+    handles = []
+    if progress_cb:
+        loop = asyncio.get_running_loop()
+        whole = math.ceil(delay)
+        tick(whole)
+        handles = [loop.call_later(delay - r, tick, r) for r in range(whole - 1, 0, -1)]
+    try:
+        await asyncio.sleep(delay)
+    finally:
+        for h in handles:
+            h.cancel()
+
+
 async def run_launch_sequence(apps, progress_cb=None):
     """Sequentially run apps, showing a *single-line live countdown* between launches."""
     total = len(apps)
+    refresh_log_config()  # pick up a toggle made in Settings since the last run
     log(f"▶️ Run sequence start: {total} item(s)")
 
     for idx, app in enumerate(apps, start=1):
@@ -130,16 +226,13 @@ async def run_launch_sequence(apps, progress_cb=None):
         # --- Countdown between apps (preserved UX) ---
         if idx < total and delay > 0:
             log(f"⏳ Waiting {delay}s before next app")
-            for remaining in range(int(delay), 0, -1):
-                if progress_cb:
-                    # overwrite same line (no newline)
-                    progress_cb(f"⏳ Waiting {remaining:>2}s before next...", end="\r")
-                await asyncio.sleep(1)
+            await _countdown(delay, progress_cb)
 
             # Clear line once countdown finishes
             if progress_cb:
                 progress_cb(" " * 60, end="\r")
 
     log("✅ Run sequence done")
+    flush_log()
     if progress_cb:
         progress_cb("✅ Done.")
@@ -1,8 +1,10 @@
 # core/storage.py
-import json
+import hashlib
 import os
+from functools import cache
 
 from core.app_settings import APP_SETTINGS
+from core.utils import json_dumps, json_loads
 
 # ==========================================================
 # Fixed, explicit AppData path (no QStandardPaths)
@@ -12,37 +14,84 @@ BASE_DIR = os.path.join(os.environ.get("APPDATA", ""), APP_NAME)
 LAUNCHERS_FILE_NAME = "launchers_config.json"
 DATA_PATH = os.path.join(BASE_DIR, LAUNCHERS_FILE_NAME)
 
-# Make sure folder exists; recreate if deleted
-os.makedirs(BASE_DIR, exist_ok=True)
+# Digest of the last bytes written by save_launches (skip identical rewrites)
+_last_saved_digest = None
+
+# Last parsed launcher list, keyed on the file's (mtime_ns, size)
+_launches_cache = (None, None)
 
 # ==========================================================
 # Core helpers
 # ==========================================================
+@cache
+def _data_path_cached() -> str:
+    # Make sure folder exists (once per process; save_launches recreates it if deleted)
+    os.makedirs(BASE_DIR, exist_ok=True)
+    return DATA_PATH
+
+
 def get_data_path() -> str:
     """Return absolute path for launchers_config.json."""
-    # Recreate folder if user deleted it during runtime
-    if not os.path.exists(BASE_DIR):
-        os.makedirs(BASE_DIR, exist_ok=True)
-    return DATA_PATH
+    return _data_path_cached()
+
+
+def _copy_launches(data):
+    """Fresh list/dict copies, so callers can mutate without touching the cache."""
+    return [
+        {**b, "paths": [dict(p) for p in b.get("paths", [])]} if isinstance(b, dict) else b
+        for b in data
+    ]
 
 
 def load_launches():
-    """Load launcher data from disk. Returns [] if file missing or broken."""
+    """Load launcher data from disk. Returns [] if file missing or broken.
+
+    The parsed list is cached until the file's mtime or size changes.
+    """
+    global _launches_cache
     path = get_data_path()
-    if not os.path.isfile(path):
-        return []
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
+        st = os.stat(path)
+        key = (st.st_mtime_ns, st.st_size)
+        if key != _launches_cache[0]:
+            with open(path, "rb") as f:
+                _launches_cache = (key, json_loads(f.read()))
+        return _copy_launches(_launches_cache[1])
+    except Exception:  # missing file included: no separate exists() stat
         return []
 
 
 def save_launches(data):
-    """Save launcher data safely into the unified AppData folder."""
+    """Save launcher data safely into the unified AppData folder.
+
+    Writes to a temp file and swaps it in with os.replace, so a crash can
+    never leave a half-written file; identical content is not rewritten.
+    """
+    global _last_saved_digest
     path = get_data_path()
     try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        data_bytes = json_dumps(data)
+        digest = hashlib.blake2b(data_bytes).digest()
+        if digest == _last_saved_digest and os.path.isfile(path):
+            return
+        tmp = path + ".tmp"
+        try:
+            try:
+                f = open(tmp, "wb")
+            except FileNotFoundError:
+                # Folder was deleted while the app was running: recreate it
+                os.makedirs(BASE_DIR, exist_ok=True)
+                f = open(tmp, "wb")
+            with f:
+                f.write(data_bytes)
+            os.replace(tmp, path)
+        except OSError:
+            # Don't leave a stray launchers_config.json.tmp behind
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+        _last_saved_digest = digest
     except Exception as e:
         raise RuntimeError(f"Failed to save launchers: {e}")
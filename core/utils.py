@@ -1,6 +1,26 @@
 # core/utils.py
-import re
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Characters Windows forbids in file names -> "_"
+_BAD_FILENAME_CHARS = str.maketrans(dict.fromkeys('<>:"/\\|?*', "_"))
 
 def sanitize_filename(name: str) -> str:
     """Return a Windows-safe version of a filename."""
-    return re.sub(r'[<>:"/\\|?*]', "_", name).strip()
+    return name.translate(_BAD_FILENAME_CHARS).strip()
+
+def json_loads(data):
+    """Parse JSON text or bytes (orjson when installed, stdlib json otherwise)."""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(obj) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON bytes (orjson when installed)."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
@@ -3,31 +3,58 @@ import asyncio
 import os
 import sys
 
-from PyQt6.QtGui import QIcon
-from PyQt6.QtWidgets import QApplication
+# qasync picks its Qt binding from QT_API, then from whatever binding is already
+# imported: pin both to PyQt6 before importing it (PyQt5/PySide may be installed too)
+os.environ["QT_API"] = "pyqt6"
+import PyQt6.QtWidgets  # noqa: F401  (imported before qasync on purpose)
+
+try:
+    import qasync
+except ImportError:
+    qasync = None
 
 from core.app_settings import APP_SETTINGS
-from core.launcher_logic import run_launch_sequence
-from core.storage import get_data_path, load_launches, save_launches
-from ui.main_window.main_window import MainWindow
-from ui.theme_manager import ThemeManager
 
 
 def run_direct_if_requested() -> bool:
     """If started with: --launch "<name>", run that launch and exit. Returns True if handled."""
     if len(sys.argv) >= 3 and sys.argv[1] == "--launch":
         from PyQt6.QtWidgets import QApplication, QMessageBox
+
+        from core.launcher_logic import run_launch_sequence
+        from core.storage import load_launches
         app = QApplication([])
 
         target = sys.argv[2]
-        launches = load_launches()
-        match = next((l for l in launches if l.get("name") == target), None)
+        # name -> launch; first entry wins on duplicate names, like the old scan
+        by_name = {}
+        for l in load_launches():
+            by_name.setdefault(l.get("name"), l)
+        match = by_name.get(target)
         if not match:
             QMessageBox.warning(None, "App Launcher", f"No App Launch found named: {target}")
             return True
 
         try:
-            asyncio.run(run_launch_sequence(match["paths"]))
+            if qasync:
+                # Drive the launches from Qt's own loop, so dialogs stay responsive
+                loop = qasync.QEventLoop(app)
+                asyncio.set_event_loop(loop)
+                with loop:
+                    loop.run_until_complete(run_launch_sequence(match["paths"]))
+            else:
+                # No qasync: step asyncio in short slices and let Qt handle events between them
+                loop = asyncio.new_event_loop()
+                asyncio.set_event_loop(loop)
+                try:
+                    task = loop.create_task(run_launch_sequence(match["paths"]))
+                    while not task.done():
+                        loop.run_until_complete(asyncio.wait({task}, timeout=0.05))
+                        app.processEvents()
+                    task.result()  # re-raise a launch error for the message box below
+                finally:
+                    loop.close()
+                    asyncio.set_event_loop(None)
         except Exception as e:
             QMessageBox.critical(None, "App Launcher", str(e))
         return True
@@ -38,6 +65,14 @@ if __name__ == "__main__":
     if run_direct_if_requested():
         sys.exit(0)
 
+    # UI-only imports: the headless --launch path above never pays for these
+    from PyQt6.QtGui import QIcon
+    from PyQt6.QtWidgets import QApplication
+
+    from core.storage import get_data_path, save_launches
+    from ui.main_window.main_window import MainWindow
+    from ui.theme_manager import ThemeManager
+
     app = QApplication(sys.argv)
 
         # === First-run setup ===
@@ -72,9 +107,14 @@ if __name__ == "__main__":
 
     w.show()
 
-    # 🔹 Force a repaint of all widgets (ensures no residual flicker)
+    # 🔹 Schedule a repaint of all widgets (ensures no residual flicker)
     for widget in app.topLevelWidgets():
         widget.update()
-        widget.repaint()
 
+    if qasync:
+        # One loop for Qt and asyncio: launches run as tasks on the GUI thread
+        loop = qasync.QEventLoop(app)
+        asyncio.set_event_loop(loop)
+        with loop:
+            sys.exit(loop.run_forever())
     sys.exit(app.exec())
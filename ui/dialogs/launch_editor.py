@@ -1,22 +1,155 @@
 import os
-from typing import Any, Dict, Optional, cast
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Optional
 
-from PyQt6.QtCore import QEasingCurve, QPropertyAnimation, QSize, Qt, QTimer
-from PyQt6.QtGui import QColor
-from PyQt6.QtWidgets import (QDialog, QFrame, QGraphicsColorizeEffect,
-                             QHBoxLayout, QLabel, QLineEdit, QListWidget,
-                             QListWidgetItem, QPushButton, QSizePolicy,
-                             QVBoxLayout, QWidget)
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, QSize, Qt, QThreadPool, QTimer, pyqtSignal
+from PyQt6.QtWidgets import (QDialog, QFileDialog, QFrame, QHBoxLayout,
+                             QLabel, QLineEdit, QListWidget, QListWidgetItem,
+                             QPushButton, QSizePolicy, QVBoxLayout, QWidget)
 
 from ui.icon_loader import themed_icon
 from ui.theme_manager import ThemeManager
 from ui.widgets.draggable_list import DraggableList
-from ui.widgets.path_row import PathRow
-from ui.widgets.style_helpers import (apply_button_style, apply_frame_style,
-                                      apply_input_style, apply_label_style,
-                                      apply_tooltip_style)
+from ui.widgets.path_row import MODES, PathRow
+from ui.widgets.style_helpers import apply_label_style
+
+__all__ = ["LaunchEditor", "MODES"]
+
+
+# --- Stylesheets: built once per color combination, reused by every dialog ---
+@lru_cache(maxsize=8)
+def _name_edit_qss(border: str, base: str, hover: str, text: str, dark: bool) -> str:
+    # Same contrast logic as PathRow
+    selection_text = "#ffffff" if dark else "#000000"
+    return f"""
+        QLineEdit {{
+            border: 1px solid {border};
+            border-radius: 6px;
+            background-color: {base};
+            color: {text};
+            padding: 6px 8px;
+            selection-background-color: {hover};
+            selection-color: {selection_text};
+        }}
+        QLineEdit:hover {{
+            border: 1px solid {hover};
+        }}
+        QLineEdit:focus {{
+            border: 1px solid {hover};
+            background-color: {base};
+        }}
+    """
+
+
+@lru_cache(maxsize=8)
+def _dialog_qss(window: str, base: str, border: str, hover: str,
+                button: str, button_text: str, text: str) -> str:
+    """Everything the editor themes itself, as one sheet set on the dialog."""
+    return f"""
+        QPushButton#editorBtn, QPushButton#footerBtn {{
+            border: 1px solid {border};
+            border-radius: 6px;
+            background-color: {button};
+            color: {button_text};
+            padding: 4px;
+        }}
+        QPushButton#editorBtn:hover, QPushButton#footerBtn:hover {{
+            background-color: {hover};
+        }}
+        QPushButton#footerBtn {{
+            padding: 5px 10px;
+            margin: 0 0 5px 0;
+        }}
+        QFrame#pathListContainer {{
+            border: 1px solid {border};
+            border-radius: 8px;
+            background-color: {base};
+            margin-top: 4px;
+        }}
+        QFrame#pathListContainer:hover {{
+            border: 1px solid {hover};
+        }}
+        QListWidget#pathList {{
+            background-color: {window};
+            border: 1px solid {border};
+            border-radius: 8px;
+            outline: none;
+        }}
+        QListWidget#pathList::item {{
+            background: transparent;
+            border: none;
+            margin: 3px;
+            padding: 0px;
+        }}
+        QListWidget#pathList::item:selected {{
+            background-color: transparent;  /* PathRow handles highlight */
+            border: none;
+        }}
+        QWidget#pathRow {{
+            background-color: {window};
+            border-radius: 8px;
+        }}
+        QWidget#pathRow[selected="true"] {{
+            background-color: {hover};
+        }}
+        QToolTip {{
+            background-color: {hover};
+            color: {text};
+            border: 1px solid {border};
+            border-radius: 6px;
+            padding: 4px 8px;
+        }}
+    """
+
+
+@lru_cache(maxsize=8)
+def _msg_qss(color: str) -> str:
+    return f"font-size:12px; color:{color}; padding-right: 15px;"
+
+
+@lru_cache(maxsize=4)
+def _flash_qss(color: str) -> str:
+    return f"\nQLineEdit {{ border: 1px solid {color}; }}"
+
+
+@lru_cache(maxsize=256)
+def _normalize_path_cached(path: str) -> str:
+    """See LaunchEditor._normalize_path; cached so unchanged rows are free on re-save."""
+    path = path.strip().strip("'\"")              # remove surrounding quotes
+    if not path:
+        return ""
+    if path.startswith("~"):
+        path = os.path.expanduser(path)           # handle ~user
+    if "%" in path or "$" in path:
+        path = os.path.expandvars(path)           # handle %VAR% or $VAR
+    return os.path.normpath(path)                 # fix slashes, .. etc.
+
+
+def _path_exists(path: str) -> bool:
+    return bool(path) and os.path.exists(path)
+
+
+class _PathValidator(QObject):
+    """Stats normalized paths on a QThreadPool thread; finished(norms, exists) is queued to the GUI."""
+    finished = pyqtSignal(object, object)
+
+    def __init__(self, norms: list):
+        super().__init__()
+        self.norms = norms
+
+    def run(self):
+        norms = self.norms
+        # Stat all paths at once (slow network shares block per call)
+        if len(norms) > 1:
+            with ThreadPoolExecutor(max_workers=min(16, len(norms))) as ex:
+                exists = list(ex.map(_path_exists, norms))
+        else:
+            exists = [_path_exists(p) for p in norms]
+        self.finished.emit(norms, exists)
 
-MODES = ["Normal", "Maximized", "Minimized"]
 
 class LaunchEditor(QDialog):
     def __init__(
@@ -30,70 +163,16 @@ class LaunchEditor(QDialog):
         super().__init__(parent)
 
         # ✅ Now it's safe to access QWidget methods
-        if existing:
-            name = existing.get("name", "Launcher")
-            self.setWindowTitle(f"Edit {name}")
-        else:
-            self.setWindowTitle("Create Launcher")
-
         self.setMinimumSize(740, 580)
         self.setModal(True)
         self.on_save = on_save
 
-        # === Theme setup (define first, call later) ===
-        def apply_input_theme():
-            """Apply theme colors to all QLineEdit and spinbox-like inputs."""
-            all_themes = ThemeManager.load_themes()
-            dark = ThemeManager.is_dark()
-            colors = all_themes["dark" if dark else "light"]
-
-            border = colors["Border"]
-            base = colors["Base"]
-            hover = colors["Hover"]
-            text = colors["Text"]
-
-            # Same contrast logic as PathRow
-            selection_bg = hover
-            selection_text = "#ffffff" if dark else "#000000"
-
-            self.default_name_style = f"""
-                QLineEdit {{
-                    border: 1px solid {border};
-                    border-radius: 6px;
-                    background-color: {base};
-                    color: {text};
-                    padding: 6px 8px;
-                    selection-background-color: {selection_bg};
-                    selection-color: {selection_text};
-                }}
-                QLineEdit:hover {{
-                    border: 1px solid {hover};
-                }}
-                QLineEdit:focus {{
-                    border: 1px solid {hover};
-                    background-color: {base};
-                }}
-            """
-
-            # Apply to inputs if already created
-            if hasattr(self, "name_edit"):
-                self.name_edit.setStyleSheet(self.default_name_style)
-
-            if hasattr(self, "listw"):
-                for i in range(self.listw.count()):
-                    row = self.listw.itemWidget(self.listw.item(i))
-                    if not row:
-                        continue
-                    for edit in row.findChildren(QLineEdit):
-                        edit.setStyleSheet(self.default_name_style)
-
         # === UI setup ===
         card = QFrame()
         card.setObjectName("card")
 
         # --- Name field ---
-        name_lbl = QLabel("Launcher Name")
-        apply_label_style(name_lbl, bold=True)
+        self._name_lbl = QLabel("Launcher Name")  # styled in _apply_theme
         name_container = QFrame()
         name_container.setStyleSheet("border: none;")
         name_layout = QHBoxLayout(name_container)
@@ -101,20 +180,17 @@ class LaunchEditor(QDialog):
         name_layout.setSpacing(0)
 
         # QLineEdit
-        self.name_edit = QLineEdit(existing["name"] if existing else "")
+        self.name_edit = QLineEdit()
         self.name_edit.setPlaceholderText("Enter launcher name...")
         self.name_edit.setMinimumHeight(32)
         name_layout.addWidget(self.name_edit)
 
-        # Apply theme after creating name_edit
-        apply_input_theme()
-        apply_tooltip_style(self)
-
-        # Connect live updates
-        ThemeManager.instance().theme_changed.connect(
-            lambda _: (apply_input_theme(), apply_tooltip_style(self),
-                    self._refresh_button_styles(), self._refresh_list_container())
-        )
+        # Live updates: a burst of theme_changed signals restyles the dialog once
+        self._theme_refresh_timer = QTimer(self)
+        self._theme_refresh_timer.setSingleShot(True)
+        self._theme_refresh_timer.setInterval(0)
+        self._theme_refresh_timer.timeout.connect(self._do_theme_refresh)
+        ThemeManager.instance().theme_changed.connect(self._schedule_theme_refresh)
 
         # --- Info icon ---
         self._name_trailing_action = self.name_edit.addAction(
@@ -128,7 +204,7 @@ class LaunchEditor(QDialog):
         name_box = QHBoxLayout()
         name_box.setContentsMargins(0, 0, 0, 0)
         name_box.setSpacing(8)
-        name_box.addWidget(name_lbl)
+        name_box.addWidget(self._name_lbl)
         name_box.addWidget(name_container, 1)
 
         # --- Paths list + Add button row ---
@@ -139,12 +215,11 @@ class LaunchEditor(QDialog):
         paths_lbl = QLabel("Paths to Launch")
         paths_lbl.setStyleSheet("font-weight: 700;")
 
-        add_btn = QPushButton()
-        add_btn.setIcon(themed_icon("add.svg"))
+        self._add_btn = add_btn = QPushButton()  # icon set in _apply_theme
+        add_btn.setObjectName("editorBtn")
         add_btn.setToolTip("Add new path")
         add_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         add_btn.setFixedSize(36, 36)
-        apply_button_style(add_btn)
 
         paths_row.addWidget(paths_lbl)
         paths_row.addStretch(1)       # push button to the right
@@ -152,71 +227,45 @@ class LaunchEditor(QDialog):
 
         # --- List widget setup ---
         self.listw = DraggableList()
+        self.listw.setObjectName("pathList")
         self.listw.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
         self.listw.setDragEnabled(False)
         self.listw.setAcceptDrops(False)
         self.listw.setDropIndicatorShown(False)
-        # Remove default sunken border and background
-        self.listw.setFrameShape(QFrame.Shape.NoFrame)
-        colors = ThemeManager.load_themes()["dark" if ThemeManager.is_dark() else "light"]
-        base = colors["Base"]
-        border = colors["Border"]
-
-        self.listw.setStyleSheet(f"""
-            QListWidget {{
-                background-color: transparent;
-                border: none;
-            }}
-            QListWidget::item {{
-                background-color: transparent;
-                border: none;
-                margin: 2px;
-            }}
-        """)
-
-
+        # Every PathRow is the same height: let the view lay out from one size hint,
+        # in batches rather than one pass per inserted row
+        self.listw.setUniformItemSizes(True)
+        self.listw.setLayoutMode(QListWidget.LayoutMode.Batched)
+        self.listw.setBatchSize(64)
+        self.listw.setResizeMode(QListWidget.ResizeMode.Fixed)
         self.listw.setCursor(Qt.CursorShape.ArrowCursor)
         self.listw.viewport().setCursor(Qt.CursorShape.ArrowCursor)
 
-        add_btn.clicked.connect(lambda: self._add_row())
-
-
-        # --- Themed list background and item styling ---
-        colors = ThemeManager.load_themes()["dark" if ThemeManager.is_dark() else "light"]
-        base = colors["Base"]
-        window = colors["Window"]
-        hover = colors["Hover"]
-        border = colors["Border"]
-
-        self.listw.setStyleSheet(f"""
-            QListWidget {{
-                background-color: {window};
-                border: 1px solid {border};
-                border-radius: 8px;
-                outline: none;
-            }}
-            QListWidget::item {{
-                background: transparent;
-                border: none;
-                margin: 3px;
-                padding: 0px;
-            }}
-            QListWidget::item:selected {{
-                background-color: transparent;  /* PathRow handles highlight */
-                border: none;
-            }}
-        """)
+        add_btn.clicked.connect(self._add_paths)
 
+
+        # Remove default sunken border and background
         self.listw.setFrameShape(QFrame.Shape.NoFrame)
         self.listw.setAutoFillBackground(False)
         self.listw.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
 
         # Connect selection changes for theme-based highlight
+        self._selected_row = None
         self.listw.itemSelectionChanged.connect(self._update_row_selection)
 
-        # --- Preload rows ---
-        for p in (existing["paths"] if existing else []):
-            self._add_row(p.get("path", ""), p.get("delay", 0.0), p.get("start_option", "Normal"))
+        # (item, PathRow) in list order, kept in sync on add/remove/move
+        self._rows: list[tuple[QListWidgetItem, PathRow]] = []
+        self.listw.rowMoved.connect(self._on_row_moved)
+
+        # Invalid rows outside the viewport, flashed when scrolled to (see _save)
+        self._pending_flashes = []
+        self.listw.verticalScrollBar().valueChanged.connect(self._drain_pending_flashes)
+
+        # Flashed inputs and the one timer that restores them (see _flash_widget)
+        self._flashed = set()
+        self._flash_timer = QTimer(self)
+        self._flash_timer.setSingleShot(True)
+        self._flash_timer.timeout.connect(self._restore_flashed)
 
         # --- Inner layout ---
         inner = QVBoxLayout(card)
@@ -240,19 +289,11 @@ class LaunchEditor(QDialog):
         list_layout.addWidget(self.listw)
         inner.addWidget(list_container, 1)
 
-        # Apply initial container style
-        apply_frame_style(list_container, "pathListContainer")
-
-
         # --- Footer (inside card) ---
         save_btn = QPushButton("Save")
         cancel_btn = QPushButton("Cancel")
-        apply_button_style(save_btn)
-        apply_button_style(cancel_btn)
-        padding = "5 10 5 10"
-        margin = "0 0 5 0"
-        save_btn.setStyleSheet(f"padding: {padding}px; margin: {margin}px;")
-        cancel_btn.setStyleSheet(f"padding: {padding}px; margin: {margin}px;")
+        save_btn.setObjectName("footerBtn")
+        cancel_btn.setObjectName("footerBtn")
 
         
         # --- Footer (centered inside card) ---
@@ -278,18 +319,6 @@ class LaunchEditor(QDialog):
         root.setContentsMargins(0, 18, 0, 10)
         root.setSpacing(5)
 
-        # --- Inline message (right aligned with clean padding) ---
-        msg_container = QHBoxLayout()
-        msg_container.setContentsMargins(0, 0, 18, 0)  # ⬅ right padding from window edge
-        msg_container.setSpacing(0)
-
-        self.msg_label = QLabel("")
-        self.msg_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        self.msg_label.setStyleSheet("font-size:12px; color:#e74c3c;")
-        msg_container.addWidget(self.msg_label, alignment=Qt.AlignmentFlag.AlignRight)
-
-        root.addLayout(msg_container)
-
         center_layout = QHBoxLayout()
         center_layout.setContentsMargins(14, 0, 14, 0)
         center_layout.setSpacing(0)
@@ -297,24 +326,117 @@ class LaunchEditor(QDialog):
         center_layout.addWidget(card, 1)
         root.addLayout(center_layout, 1)
 
-        # Message label below card (optional, can also move inside if you prefer)
+        # --- Inline message below the card (right aligned) ---
+        self.msg_label = QLabel("")
+        self.msg_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        self.msg_label.setStyleSheet("font-size:12px; color:#e74c3c;")
         root.addWidget(self.msg_label)
 
         cancel_btn.clicked.connect(self.reject)
         save_btn.clicked.connect(self._save)
+        self._footer_btns = (cancel_btn, save_btn)  # disabled while paths are checked
 
         # ✅ Set cursor explicitly (Qt API, not QSS)
         list_container.setCursor(Qt.CursorShape.ArrowCursor)
 
-    def _refresh_button_styles(self):
-        for btn in self.findChildren(QPushButton):
-            apply_button_style(btn)
+        # --- Fill in the launcher being edited (or blank for a new one) ---
+        self.reset(existing)
 
-    def _refresh_list_container(self):
-        """Reapply list container theme when toggled."""
-        container = self.findChild(QFrame, "pathListContainer")
-        if container:
-            apply_list_container_style(container)
+    def reset(self, existing: Optional[Dict[str, Any]] = None):
+        """Repopulate the dialog for another launcher, reusing the built widget tree."""
+        # The theme may have changed while the dialog was hidden (no-op if it didn't)
+        self._apply_theme()
+
+        if existing:
+            name = existing.get("name", "Launcher")
+            self.setWindowTitle(f"Edit {name}")
+        else:
+            self.setWindowTitle("Create Launcher")
+
+        self.name_edit.setText(existing["name"] if existing else "")
+        self.name_edit.setStyleSheet(self.default_name_style)
+        self.msg_label.setText("")
+        self._pending_flashes = []
+        self._flash_timer.stop()
+        self._flashed.clear()
+        self._selected_row = None
+        self._set_validating(None)
+
+        # --- Preload rows ---
+        with self._batched_rows():
+            self.listw.clear()
+            self._rows.clear()
+            for p in (existing["paths"] if existing else []):
+                self._add_row(p.get("path", ""), p.get("delay", 0.0), p.get("start_option", "Normal"))
+
+    @contextmanager
+    def _batched_rows(self):
+        """Bulk row changes: one layout/repaint pass, no per-row selection signals."""
+        self.listw.setUpdatesEnabled(False)
+        self.listw.blockSignals(True)
+        try:
+            yield
+        finally:
+            self.listw.blockSignals(False)
+            self.listw.setUpdatesEnabled(True)
+            self.listw.updateGeometry()
+
+    def _schedule_theme_refresh(self, _is_dark: bool = None):
+        # start() on a running single-shot timer restarts it: bursts collapse into one refresh
+        self._theme_refresh_timer.start()
+
+    def _do_theme_refresh(self):
+        """Restyle inputs and the dialog sheet with one repaint at the end."""
+        self.setUpdatesEnabled(False)
+        try:
+            self._apply_theme()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _apply_theme(self):
+        """Resolve the theme once and restyle everything the dialog themes itself."""
+        dark = ThemeManager.is_dark()
+        colors = ThemeManager.colors(dark)
+
+        # Same palette as last time (theme re-applied, toggled back and forth): nothing to do
+        key = (dark, tuple(colors.items()))
+        if key == getattr(self, "_theme_key", None):
+            return
+        self._theme_key = key
+
+        self._apply_input_theme(colors, dark)
+        self._apply_dialog_theme(colors)
+
+        # Widgets themed outside the sheets: label color and light/dark icon variants
+        apply_label_style(self._name_lbl, bold=True)
+        self._name_trailing_action.setIcon(themed_icon("info-solid-full.svg"))
+        self._add_btn.setIcon(themed_icon("add.svg"))
+
+        # Row buttons: walk the row registry, not findChildren() over the whole tree
+        for _, row in getattr(self, "_rows", ()):
+            row.refresh_button_styles()
+
+    def _apply_input_theme(self, colors: dict, dark: bool):
+        """Apply theme colors to all QLineEdit and spinbox-like inputs."""
+        self.default_name_style = _name_edit_qss(
+            colors["Border"], colors["Base"], colors["Hover"], colors["Text"], dark
+        )
+
+        # Apply to inputs if already created
+        if hasattr(self, "name_edit"):
+            self.name_edit.setStyleSheet(self.default_name_style)
+
+        for _, row in getattr(self, "_rows", ()):
+            row.path_edit.setStyleSheet(self.default_name_style)
+
+    def _apply_dialog_theme(self, c: dict):
+        """One stylesheet on the dialog for its buttons, list, list container and tooltips.
+
+        Qt parses it once per theme instead of once per widget; PathRows keep their own.
+        """
+        self.setStyleSheet(_dialog_qss(
+            c["Window"], c["Base"], c["Border"], c["Hover"], c["Button"], c["ButtonText"], c["Text"]
+        ))
 
 
     def _flash_name_border(self, duration: int = 3000):
@@ -323,66 +445,46 @@ class LaunchEditor(QDialog):
 
    
     def _flash_widget(self, widget: QLineEdit, color: str = "#e74c3c", duration: int = 3000):
-        """Flash only the given QLineEdit red, then fade out — isolated per widget."""
+        """Outline the given QLineEdit in `color`, then restore its normal style after `duration` ms."""
         if widget is None:
             return
 
-        # Ensure previous effect is cleared cleanly
-        existing = widget.graphicsEffect()
-        if existing:
-            existing.setEnabled(False)
-            widget.setGraphicsEffect(None)
-
-        effect = QGraphicsColorizeEffect(widget)
-        effect.setColor(QColor(color))
-        effect.setEnabled(True)
-        effect.setStrength(1.0)
-        widget.setGraphicsEffect(effect)
-
-        # Animate strength 1.0 -> 0.0
-        anim = QPropertyAnimation(effect, b"strength", self)
-        anim.setDuration(duration)
-        anim.setStartValue(1.0)
-        anim.setEndValue(0.0)
-        anim.setEasingCurve(QEasingCurve.Type.OutCubic)
-
-        # keep a reference on the widget so GC won't kill the anim early
-        if not hasattr(widget, "_flash_anims"):
-            widget._flash_anims = []
-        widget._flash_anims.append(anim)
-
-        def cleanup():
-            try:
-                widget.setGraphicsEffect(None)
-                widget._flash_anims.remove(anim)
-            except Exception:
-                pass
-
-        anim.finished.connect(cleanup)
-        anim.start()
-    
-    def _animate_reorder(self, start_row: int, end_row: int):
-        """Visually animate the list item sliding to new position."""
-        import math
-
-        from PyQt6.QtCore import QPropertyAnimation, QRect
+        # Remember the widget's own sheet once; a repeat flash just restarts the wait
+        if widget not in self._flashed:
+            widget._flash_restore = widget.styleSheet()
+            self._flashed.add(widget)
+        widget.setStyleSheet(widget._flash_restore + _flash_qss(color))
+        # One shared timer: a burst of flashes (every invalid row) restores together
+        self._flash_timer.start(duration)
+
+    def _restore_flashed(self):
+        for widget in self._flashed:
+            if sip.isdeleted(widget):
+                continue  # row was removed meanwhile
+            if widget is self.name_edit:
+                widget.setStyleSheet(self.default_name_style)
+            else:
+                widget.setStyleSheet(widget._flash_restore)
+        self._flashed.clear()
 
-        lw = self.listw
-        direction = 1 if end_row > start_row else -1
-        steps = abs(end_row - start_row)
+    def _flash_invalid_rows(self, invalid_items):
+        """Flash the invalid rows on screen now; the others flash once scrolled into view."""
+        self._pending_flashes = [(item, pe) for item, _, pe in invalid_items if pe]
+        self._drain_pending_flashes()
 
-        start_rect = lw.visualItemRect(lw.item(start_row))
-        end_rect = lw.visualItemRect(lw.item(end_row))
-        if start_rect.isNull() or end_rect.isNull():
+    def _drain_pending_flashes(self, *_):
+        if not self._pending_flashes:
             return
-
-        anim = QPropertyAnimation(lw.viewport(), b"pos")
-        anim.setDuration(100 + 50 * steps)
-        anim.setStartValue(start_rect.topLeft())
-        anim.setEndValue(end_rect.topLeft())
-        anim.setEasingCurve(QEasingCurve.Type.OutCubic)
-        anim.start(QPropertyAnimation.DeletionPolicy.DeleteWhenStopped)
-
+        viewport_rect = self.listw.viewport().rect()
+        still_hidden = []
+        for item, pe in self._pending_flashes:
+            if sip.isdeleted(pe):
+                continue  # row was removed meanwhile
+            if self.listw.visualItemRect(item).intersects(viewport_rect):
+                self._flash_widget(pe)
+            else:
+                still_hidden.append((item, pe))
+        self._pending_flashes = still_hidden
 
     # --- Helper to add new path rows ---
     def _add_row(self, path=None, delay=None, mode=None):
@@ -391,19 +493,57 @@ class LaunchEditor(QDialog):
         item.setSizeHint(QSize(0, 50))
         self.listw.addItem(item)
         self.listw.setItemWidget(item, w)
-        w.delete_btn.setIcon(themed_icon("delete.svg"))
-        w.delete_btn.setToolTip("Delete this path")
-        w.delete_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        apply_button_style(w.delete_btn)
-        w.delete_btn.setFixedSize(32, 32)
-        w.delete_btn.clicked.connect(lambda: self.listw.takeItem(self.listw.row(item)))
+        # PathRow already themes the delete button (icon, tooltip, cursor, size);
+        # the button carries its item, so a click finds the row without a scan
+        w.delete_btn._list_item = item
+        w.delete_btn.clicked.connect(self._remove_sender_row)
+        self._rows.append((item, w))
+
+    def _add_paths(self):
+        """Pick several executables at once.
+
+        Cancelling adds one blank row instead, for a folder, URL or typed path.
+        """
+        files, _ = QFileDialog.getOpenFileNames(
+            self,
+            "Choose Executables",
+            "",
+            "Executables (*.exe *.bat *.cmd *.lnk);;All files (*.*)"
+        )
+        if not files:
+            self._add_row("")
+            item, row = self._rows[-1]
+            self.listw.scrollToItem(item)
+            row.path_edit.setFocus()
+            return
+        with self._batched_rows():
+            for f in files:
+                self._add_row(f)
+
+    def _remove_sender_row(self):
+        """Remove the row whose delete button was clicked (no per-row closure)."""
+        item = getattr(self.sender(), "_list_item", None)
+        i = self.listw.row(item) if item is not None else -1
+        if i < 0:
+            return
+        self.listw.takeItem(i)
+        del self._rows[i]
+
+    def _on_row_moved(self, src: int, dst: int):
+        """Mirror a drag-reorder in self._rows; the list rebuilt the moved PathRow."""
+        del self._rows[src]
+        item = self.listw.item(dst)
+        w = self.listw.itemWidget(item)
+        w.delete_btn._list_item = item
+        w.delete_btn.clicked.connect(self._remove_sender_row)
+        self._rows.insert(dst, (item, w))
 
     # --- Inline message helper ---
     def _show_inline_message(self, text: str, color: str = "#f39c12", duration: Optional[int] = None):
         """
         Show a persistent inline message (doesn't auto-clear unless duration is given).
         """
-        self.msg_label.setStyleSheet(f"font-size:12px; color:{color}; padding-right: 15px;")
+        self.msg_label.setStyleSheet(_msg_qss(color))
         self.msg_label.setText(text)
 
         # Only clear if a duration was explicitly provided
@@ -421,16 +561,40 @@ class LaunchEditor(QDialog):
         """
         if not path:
             return ""
-        path = path.strip().strip("'\"")          # remove surrounding quotes
-        path = os.path.expanduser(path)           # handle ~user
-        path = os.path.expandvars(path)           # handle %VAR% or $VAR
-        path = os.path.normpath(path)             # fix slashes, .. etc.
-        return path
+        return _normalize_path_cached(path)
 
 
     # --- Save logic ---
     
     def _save(self):
+        # --- Collect each path row (string work only, stays on the GUI thread) ---
+        norms = [self._normalize_path(row_widget.path) for _, row_widget in self._rows]
+
+        # --- Validate off the GUI thread; _on_paths_validated picks it up ---
+        validator = _PathValidator(norms)
+        validator.finished.connect(self._on_paths_validated)
+        self._set_validating(validator)
+        QThreadPool.globalInstance().start(validator.run)
+
+    def _set_validating(self, validator: Optional[_PathValidator]):
+        self._validator = validator
+        for btn in getattr(self, "_footer_btns", ()):
+            btn.setEnabled(validator is None)
+
+    def _on_paths_validated(self, norms: list, exists: list):
+        if self.sender() is not self._validator:
+            return  # dialog was reset (or reused) while checking
+        self._set_validating(None)
+        if not self.isVisible():
+            return
+
+        # Rows edited, added or removed meanwhile: check what's there now
+        if [self._normalize_path(w.path) for _, w in self._rows] != norms:
+            self._save()
+            return
+        self._finish_save(norms, exists)
+
+    def _finish_save(self, norms: list, exists: list):
         name = (self.name_edit.text() or "").strip()
         valid_paths = []
         invalid_items: list[tuple[QListWidgetItem, PathRow, QLineEdit]] = []
@@ -442,24 +606,12 @@ class LaunchEditor(QDialog):
         else:
             self.name_edit.setStyleSheet(self.default_name_style)
 
-        # --- Validate each path row ---
-        for i in range(self.listw.count()):
-            item = self.listw.item(i)
-            row_widget = cast(Optional[PathRow], self.listw.itemWidget(item))
-            if row_widget is None:
-                continue
-
-            path_edit = getattr(row_widget, "path_edit", None)
-            if path_edit is None or not isinstance(path_edit, QLineEdit):
-                path_edit = row_widget.findChild(QLineEdit)
-
-            v = row_widget.value()
-            raw_path = (v.get("path") or "").strip()
-            norm_path = self._normalize_path(raw_path)
-
-            if not norm_path or not os.path.exists(norm_path):
-                invalid_items.append((item, row_widget, path_edit))
+        for (item, row_widget), norm_path, ok in zip(self._rows, norms, exists):
+            if not ok:
+                # path_edit is always set by PathRow.__init__
+                invalid_items.append((item, row_widget, row_widget.path_edit))
             else:
+                v = row_widget.value()  # full dict only for rows that get saved
                 v["path"] = norm_path
                 valid_paths.append(v)
 
@@ -481,11 +633,9 @@ class LaunchEditor(QDialog):
                 msg = f"Please fill name and fix {num_invalid} invalid paths."
             self._show_inline_message(msg, "#e74c3c")
             self._flash_name_border()
-            for _, _, pe in invalid_items:
-                if pe:
-                    self._flash_widget(pe)
             first_item, _, _ = invalid_items[0]
             self.listw.scrollToItem(first_item)
+            self._flash_invalid_rows(invalid_items)
             return
 
         elif should_flash_name:
@@ -505,9 +655,7 @@ class LaunchEditor(QDialog):
             self.listw.scrollToItem(first_item)
             if invalid_items[0][2]:
                 invalid_items[0][2].setFocus()
-            for _, _, pe in invalid_items:
-                if pe:
-                    self._flash_widget(pe)
+            self._flash_invalid_rows(invalid_items)
             return
 
         elif not valid_paths:
@@ -521,17 +669,19 @@ class LaunchEditor(QDialog):
         self.accept()
 
     def _update_row_selection(self):
-        """Apply theme-based highlight to selected PathRows."""
-        colors = ThemeManager.load_themes()["dark" if ThemeManager.is_dark() else "light"]
-        normal_bg = colors["Window"]
-        selected_bg = colors["Hover"]
-
-        for i in range(self.listw.count()):
-            item = self.listw.item(i)
-            row = self.listw.itemWidget(item)
-            if not row:
+        """Highlight the selected PathRow (QWidget#pathRow[selected] in the dialog sheet).
+
+        Single selection: only the previously and newly selected rows are re-polished.
+        """
+        items = self.listw.selectedItems()
+        row = self.listw.itemWidget(items[0]) if items else None
+        old = self._selected_row
+        if row is old:
+            return
+        self._selected_row = row
+        for w, selected in ((old, False), (row, True)):
+            if w is None or sip.isdeleted(w):
                 continue
-            row.setStyleSheet(f"""
-                background-color: {selected_bg if item.isSelected() else normal_bg};
-                border-radius: 8px;
-            """)
+            w.setProperty("selected", selected)
+            w.style().unpolish(w)
+            w.style().polish(w)
@@ -25,6 +25,9 @@ class SettingsDialog(QDialog):
         self.setModal(True)
         self.setFixedWidth(460)
         self.on_changed = on_changed
+        # Widgets styled from the theme colors; restyled in _apply_theme_styles
+        self._themed_labels: list[tuple[QLabel, int]] = []
+        self._themed_buttons: list[QPushButton] = []
 
         # === Root layout ===
         root = QVBoxLayout(self)
@@ -38,6 +41,7 @@ class SettingsDialog(QDialog):
         theme_row = QHBoxLayout()
         theme_label = QLabel("Theme")
         apply_label_style(theme_label, bold=True, size=14)
+        self._themed_labels.append((theme_label, 14))
         theme_row.addWidget(theme_label)
         theme_row.addStretch()
 
@@ -59,6 +63,7 @@ class SettingsDialog(QDialog):
         state_row = QHBoxLayout()
         state_label = QLabel("Default Window State")
         apply_label_style(state_label, bold=True, size=14)
+        self._themed_labels.append((state_label, 14))
         state_row.addWidget(state_label)
         state_row.addStretch()
         self.state_combo = QComboBox()
@@ -77,6 +82,7 @@ class SettingsDialog(QDialog):
         delay_row = QHBoxLayout()
         delay_label = QLabel("Default Delay Between Apps")
         apply_label_style(delay_label, bold=True, size=14)
+        self._themed_labels.append((delay_label, 14))
         delay_row.addWidget(delay_label)
         delay_row.addStretch()
         self.delay_spin = QDoubleSpinBox()
@@ -102,6 +108,7 @@ class SettingsDialog(QDialog):
         tray_row = QHBoxLayout()
         tray_label = QLabel("Minimize to Tray on Close")
         apply_label_style(tray_label, bold=True, size=14)
+        self._themed_labels.append((tray_label, 14))
         tray_row.addWidget(tray_label)
         tray_row.addStretch()
 
@@ -117,14 +124,13 @@ class SettingsDialog(QDialog):
         log_row = QHBoxLayout()
         log_label = QLabel("Debug Logging")
         apply_label_style(log_label, bold=True, size=14)
+        self._themed_labels.append((log_label, 14))
         log_row.addWidget(log_label)
         log_row.addStretch()
 
         current_debug = ThemeManager.get_setting("debug_logging", True)  # default ON
         self.debug_switch = ToggleSwitch(initial_state=current_debug)
-        self.debug_switch.clicked.connect(
-            lambda: ThemeManager.set_setting("debug_logging", self.debug_switch.isChecked())
-        )
+        self.debug_switch.clicked.connect(self._toggle_debug_logging)
         log_row.addWidget(self.debug_switch)
         launch_card.layout().addLayout(log_row)
 
@@ -141,6 +147,7 @@ class SettingsDialog(QDialog):
         # --- Open Settings Folder Button ---
         open_folder_btn = QPushButton("Open Settings Folder")
         apply_button_style(open_folder_btn)
+        self._themed_buttons.append(open_folder_btn)
         open_folder_btn.setFixedWidth(180)
         open_folder_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         open_folder_btn.clicked.connect(self._open_settings_folder)
@@ -149,38 +156,63 @@ class SettingsDialog(QDialog):
         # --- Close Button ---
         close_btn = QPushButton("Close")
         apply_button_style(close_btn)
+        self._themed_buttons.append(close_btn)
         close_btn.setFixedWidth(100)
         close_btn.clicked.connect(self.accept)
         footer.addWidget(close_btn)
         root.addLayout(footer)
 
-         # === Theme-aware Styling (Fixed + Auto-refresh) ===
-        def apply_theme_styles():
-            dark = ThemeManager.is_dark()
-
-            # === Determine correct arrow icons ===
-            theme_dir = "dark" if dark else "light"
-            up_arrow = os.path.join("resources", "icons", f"{theme_dir} icons", "spin_up.svg").replace("\\", "/")
-            down_arrow = os.path.join("resources", "icons", f"{theme_dir} icons", "spin_down.svg").replace("\\", "/")
-
-            # Use only supported Qt properties (no transition, shadow, or blur)
-            self.setStyleSheet(f"""
-                /* --- Form Controls --- */
-                QDoubleSpinBox::up-arrow {{
-                    image: url({up_arrow});
-                }}
-                QDoubleSpinBox::down-arrow {{
-                    image: url({down_arrow});
-                }}
-            """)
-
-        # Apply now
-        apply_theme_styles()
-
-        # React to future theme changes (dark/light toggle)
-        if hasattr(ThemeManager, "instance"):
-            ThemeManager.instance().theme_changed.connect(lambda _: apply_theme_styles())
+        # === Theme-aware Styling (Fixed + Auto-refresh) ===
+        self._apply_theme_styles()
 
+        # React to future theme changes (dark/light toggle); the dialog is reused across opens
+        if hasattr(ThemeManager, "instance"):
+            ThemeManager.instance().theme_changed.connect(self._apply_theme_styles)
+
+    def _apply_theme_styles(self, _is_dark: bool = None):
+        """Restyle labels, buttons and spinbox arrows for the current theme."""
+        dark = ThemeManager.is_dark()
+
+        for label, size in self._themed_labels:
+            apply_label_style(label, bold=True, size=size)
+        for btn in self._themed_buttons:
+            apply_button_style(btn)
+        if hasattr(self, "state_combo"):
+            apply_combobox_style(self.state_combo)
+
+        # === Determine correct arrow icons ===
+        theme_dir = "dark" if dark else "light"
+        up_arrow = os.path.join("resources", "icons", f"{theme_dir} icons", "spin_up.svg").replace("\\", "/")
+        down_arrow = os.path.join("resources", "icons", f"{theme_dir} icons", "spin_down.svg").replace("\\", "/")
+
+        # Use only supported Qt properties (no transition, shadow, or blur)
+        self.setStyleSheet(f"""
+            /* --- Form Controls --- */
+            QDoubleSpinBox::up-arrow {{
+                image: url({up_arrow});
+            }}
+            QDoubleSpinBox::down-arrow {{
+                image: url({down_arrow});
+            }}
+        """)
+
+    def sync_from_settings(self):
+        """Re-read settings into the controls, so one dialog instance can be reopened."""
+        SettingsDialog.refresh_settings_cache()
+        self._apply_theme_styles()  # settings.json may have switched the theme meanwhile
+        self.theme_switch.set_state(ThemeManager.is_dark())
+        self.tray_switch.set_state(bool(ThemeManager.get_setting("minimize_to_tray", False)))
+        self.debug_switch.set_state(bool(ThemeManager.get_setting("debug_logging", True)))
+
+        # Writing these back would be a no-op save; keep their change handlers quiet
+        for w in (self.state_combo, self.delay_spin):
+            w.blockSignals(True)
+        try:
+            self.state_combo.setCurrentText(ThemeManager.get_setting("default_window_state", "Normal"))
+            self.delay_spin.setValue(int(ThemeManager.get_setting("default_delay", 0)))
+        finally:
+            for w in (self.state_combo, self.delay_spin):
+                w.blockSignals(False)
 
     # === Helper: Create section wrapper ===
     def _create_section(self, title: str) -> QFrame:
@@ -196,6 +228,7 @@ class SettingsDialog(QDialog):
         title_label = QLabel(title)
         title_label.setObjectName("SectionTitle")
         apply_label_style(title_label, bold=True, size=24)
+        self._themed_labels.append((title_label, 24))
         layout.addWidget(title_label)
 
         underline = QFrame()
@@ -226,6 +259,14 @@ class SettingsDialog(QDialog):
                 "Settings folder could not be found."
             )
 
+    # === Toggle Debug Logging ===
+    def _toggle_debug_logging(self):
+        enabled = self.debug_switch.isChecked()
+        ThemeManager.set_setting("debug_logging", enabled)
+        # Deferred like the other launcher_logic imports; log() uses the new value right away
+        from core.launcher_logic import set_debug
+        set_debug(enabled)
+
     # === Toggle Theme Logic ===
     def toggle_theme(self):
         new_theme = "dark" if self.theme_switch.isChecked() else "light"
@@ -236,6 +277,6 @@ class SettingsDialog(QDialog):
 
     @staticmethod
     def refresh_settings_cache():
-        """Force reload from disk, ignoring cache."""
-        ThemeManager._cached_settings = None
+        """Pick up external edits to settings.json; re-parses only if its mtime changed."""
+        ThemeManager._last_settings_check = 0.0
         ThemeManager._load_settings()
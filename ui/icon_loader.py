@@ -1,19 +1,27 @@
 # ui/icon_loader.py
 import os
+from functools import lru_cache
 
 from PyQt6.QtGui import QIcon
 
 from ui.theme_manager import ThemeManager
 
+ICONS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "resources", "icons"))
+
 
 def themed_icon(name: str) -> QIcon:
     """
     Loads the correct icon (dark/light) based on current theme.
     Example: themed_icon("add.svg")
     """
-    base_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "resources", "icons"))
-    folder = "light icons" if ThemeManager.is_dark() else "dark icons"
-    icon_path = os.path.join(base_path, folder, name)
+    return _themed_icon_cached(name, ThemeManager.is_dark())
+
+
+@lru_cache(maxsize=64)
+def _themed_icon_cached(name: str, dark: bool) -> QIcon:
+    """One shared QIcon per (icon, theme); QIcon is implicitly shared, so reuse is safe."""
+    folder = "light icons" if dark else "dark icons"
+    icon_path = os.path.join(ICONS_DIR, folder, name)
 
     if not os.path.exists(icon_path):
         print(f"⚠️ Missing icon: {icon_path}")
@@ -1,20 +1,16 @@
 # ui/main_window/actions.py
-import json
 import os
 import sys
 
-import pythoncom
-from PyQt6.QtCore import QStandardPaths, Qt, QThread
+from PyQt6.QtCore import QStandardPaths, Qt
 from PyQt6.QtWidgets import QApplication, QFileDialog, QMessageBox, QDialog
-from win32com.client import Dispatch
 
 from core.app_settings import APP_SETTINGS
 from core.storage import load_launches, save_launches
 from ui.dialogs.launch_editor import LaunchEditor
 from ui.dialogs.settings_dialog import SettingsDialog
 from ui.icon_loader import themed_icon
-from ui.main_window.launch_worker import LaunchWorker
-from core.utils import sanitize_filename
+from core.utils import json_dumps, json_loads, sanitize_filename
 from ui.theme_manager import ThemeManager
 
 APP_NAME = APP_SETTINGS["window_title"]
@@ -23,6 +19,9 @@ class Actions:
     def __init__(self, window):
         self.window = window
         self._delete_pending = None
+        self._launch_workers = set()
+        self._editor = None
+        self._settings_dialog = None
 
     # -------------------- MENU --------------------
     def build_menu(self, menubar):
@@ -50,32 +49,45 @@ class Actions:
 
 
     # -------------------- CRUD --------------------
+    def _open_editor(self, existing, on_save):
+        """Show the launcher editor, building it once and resetting it on later opens."""
+        if self._editor is None:
+            self._editor = LaunchEditor(existing=existing, on_save=on_save, parent=self.window)
+        else:
+            self._editor.reset(existing)
+            self._editor.on_save = on_save
+        self._editor.exec()
+
     def add_launcher(self):
         def on_save(data):
             self.window.launches.append(data)
             save_launches(self.window.launches)
-            self.window._refresh_list()
-        LaunchEditor(on_save=on_save, parent=self.window).exec()
+            self.window._append_row()
+        self._open_editor(None, on_save)
 
     def edit_launcher(self, i):
         def on_save(data):
             self.window.launches[i] = data
             save_launches(self.window.launches)
-            self.window._refresh_list()
-        LaunchEditor(existing=self.window.launches[i], on_save=on_save, parent=self.window).exec()
+            self.window._update_row(i)
+        self._open_editor(self.window.launches[i], on_save)
 
     def delete_launcher(self, i):
         if self._delete_pending == i:
             name = self.window.launches[i].get("name", "Untitled")
             self.window.launches.pop(i)
             save_launches(self.window.launches)
-            self.window._refresh_list()
+            self.window._remove_row(i)
             self._delete_pending = None
         else:
             self._delete_pending = i
             self.window._show_message("⚠️ Click delete again to confirm.")
 
     def export_shortcut(self, i):
+        # Deferred: COM bindings are only needed when a shortcut is exported
+        import pythoncom
+        from win32com.client import Dispatch
+
         try:
             bundle = self.window.launches[i]
             name = bundle.get("name", "Untitled").strip() or "Untitled"
@@ -111,39 +123,41 @@ class Actions:
     # -------------------- RUN --------------------
     def run_launcher(self, i):
         """Run the selected launcher asynchronously with live status updates."""
+        # Deferred: pulls in asyncio + launcher_logic (win32) only on first run
+        from ui.main_window.launch_worker import LaunchWorker
+
         bundle = self.window.launches[i]
         name = bundle.get("name", "Untitled")
 
-        # --- Create worker + thread ---
-        thread = QThread(self.window)
+        # --- Create worker (runs on the shared launch loop, no per-click thread) ---
         worker = LaunchWorker(bundle["paths"], name)
-        worker.moveToThread(thread)
 
         # --- Connect signals ---
-        thread.started.connect(worker.run)
         worker.progress.connect(self.window._show_message)
         worker.finished.connect(lambda msg: self.window._show_message(msg, 3000))
 
-        # --- Clean up thread safely ---
-        worker.finished.connect(thread.quit)
-        thread.finished.connect(worker.deleteLater)
-        thread.finished.connect(thread.deleteLater)
-
-        # --- Keep strong refs to prevent GC ---
-        self._launch_thread = thread
-        self._launch_worker = worker
+        # --- Keep strong refs until done (launches may overlap) ---
+        self._launch_workers.add(worker)
+        worker.finished.connect(lambda _: self._launch_workers.discard(worker))
 
-        # --- Start thread ---
-        thread.start()
+        # --- Start ---
+        worker.run()
 
 
     # -------------------- SETTINGS --------------------
     def _open_settings(self):
-        def on_changed(v: bool):
-            ThemeManager.set_dark(v)
-            app = QApplication.instance()
-            ThemeManager.apply(app, v)
-        SettingsDialog(self.window, dark=ThemeManager.is_dark(), on_changed=on_changed).exec()
+        """Show the settings dialog, building it once and re-syncing it on later opens."""
+        if self._settings_dialog is None:
+            def on_changed(v: bool):
+                ThemeManager.set_dark(v)
+                app = QApplication.instance()
+                ThemeManager.apply(app, v)
+            self._settings_dialog = SettingsDialog(
+                self.window, dark=ThemeManager.is_dark(), on_changed=on_changed
+            )
+        else:
+            self._settings_dialog.sync_from_settings()
+        self._settings_dialog.exec()
 
     # -------------------- IMPORT/EXPORT --------------------
     def _export_launchers(self):
@@ -155,8 +169,8 @@ class Actions:
         )
         if not file: return
         try:
-            with open(file, "w", encoding="utf-8") as f:
-                json.dump(self.window.launches, f, indent=2)
+            with open(file, "wb") as f:
+                f.write(json_dumps(self.window.launches))
             self.window._show_message(f"✅ Exported: {os.path.basename(file)}")
         except Exception as e:
             self.window._show_message(f"❌ Export failed: {e}")
@@ -165,8 +179,8 @@ class Actions:
         file, _ = QFileDialog.getOpenFileName(self.window, "Import Launchers", "", "JSON Files (*.json)")
         if not file: return
         try:
-            with open(file, "r", encoding="utf-8") as f:
-                imported = json.load(f)
+            with open(file, "rb") as f:
+                imported = json_loads(f.read())
         except Exception as e:
             QMessageBox.critical(self.window, "Invalid File", str(e))
             return
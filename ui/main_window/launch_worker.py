@@ -1,11 +1,54 @@
 # ui/main_window/launch_worker.py
 import asyncio
-from PyQt6.QtCore import QObject, pyqtSignal
+import threading
+
+from PyQt6.QtCore import QCoreApplication, QObject, pyqtSignal
 from core.launcher_logic import run_launch_sequence
 
+# --- Shared background event loop (created once, reused by every launch) ---
+_loop = None
+_loop_thread = None
+_loop_lock = threading.Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Return the long-lived asyncio loop, starting its thread on first use."""
+    global _loop, _loop_thread
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            _loop_thread = threading.Thread(target=_loop.run_forever, name="LaunchLoop", daemon=True)
+            _loop_thread.start()
+            app = QCoreApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(shutdown_background_loop)
+    return _loop
+
+
+def shutdown_background_loop(timeout: float = 2.0):
+    """Stop the shared loop, cancel unfinished launches and join its thread."""
+    global _loop, _loop_thread
+    with _loop_lock:
+        loop, thread = _loop, _loop_thread
+        _loop = _loop_thread = None
+    if loop is None:
+        return
+
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout)
+    if thread.is_alive():
+        return  # still busy inside a blocking call; the daemon thread dies with us
+
+    pending = asyncio.all_tasks(loop)
+    for task in pending:
+        task.cancel()
+    if pending:
+        loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+    loop.close()
+
 
 class LaunchWorker(QObject):
-    """Worker that runs the async launch sequence in its own QThread."""
+    """Runs the async launch sequence without blocking the Qt event loop."""
     progress = pyqtSignal(str)
     finished = pyqtSignal(str)
 
@@ -13,23 +56,29 @@ class LaunchWorker(QObject):
         super().__init__()
         self.apps = apps
         self.launch_name = launch_name
+        self._future = None
 
     def run(self):
-        """Run the async launch sequence in a separate event loop."""
+        """Schedule the launch sequence on the GUI loop (qasync) or the shared background loop."""
         def _emit(text: str, **_):
             self.progress.emit(text)
 
+        coro = run_launch_sequence(self.apps, progress_cb=_emit)
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(run_launch_sequence(self.apps, progress_cb=_emit))
+            # qasync: Qt and asyncio share the GUI thread, run as a plain task
+            future = asyncio.get_running_loop().create_task(coro)
+        except RuntimeError:
+            future = asyncio.run_coroutine_threadsafe(coro, _background_loop())
+        # The loop only keeps a weak reference to tasks: hold it until it's done
+        self._future = future
+        future.add_done_callback(self._on_done)
+
+    def _on_done(self, future):
+        if future.cancelled():
+            return  # shut down mid-launch; nobody is listening anymore
+        try:
+            future.result()
         except Exception as e:
             self.finished.emit(f"❌ Error: {e}")
             return
-        finally:
-            try:
-                loop.close()
-            except Exception:
-                pass
-
         self.finished.emit(f"{self.launch_name} Launched.")
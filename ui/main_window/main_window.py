@@ -172,21 +172,44 @@ class MainWindow(QMainWindow):
     # LIST LOGIC
     # -----------------------------
     def _refresh_list(self):
-        self.listw.clear()
-        for i, bundle in enumerate(self.launches):
-            name = bundle.get("name", "Untitled")
-            make = lambda f, i=i: lambda _: f(i)
-            row = LaunchListRow(
-                name,
-                make(self._run_index),
-                make(self._edit_index),
-                make(self._delete_index),
-                make(self._export_index),
-            )
-            item = QListWidgetItem()
-            item.setSizeHint(QSize(0, 58))
-            self.listw.addItem(item)
-            self.listw.setItemWidget(item, row)
+        """Full rebuild; used at startup and after import."""
+        # Suspend repaints while rebuilding so the list lays out once
+        self.listw.setUpdatesEnabled(False)
+        try:
+            self.listw.clear()
+            for bundle in self.launches:
+                self._insert_row(self.listw.count(), bundle)
+        finally:
+            self.listw.setUpdatesEnabled(True)
+
+    def _insert_row(self, i: int, bundle: dict):
+        """Create the row widget for one launcher at list position i."""
+        item = QListWidgetItem()
+        # Resolve the index on click, so rows stay correct as others come and go
+        make = lambda f: lambda _: f(self.listw.row(item))
+        row = LaunchListRow(
+            bundle.get("name", "Untitled"),
+            make(self._run_index),
+            make(self._edit_index),
+            make(self._delete_index),
+            make(self._export_index),
+        )
+        item.setSizeHint(QSize(0, 58))
+        self.listw.insertItem(i, item)
+        self.listw.setItemWidget(item, row)
+
+    def _append_row(self):
+        """Show the launcher just appended to self.launches."""
+        self._insert_row(self.listw.count(), self.launches[-1])
+
+    def _update_row(self, i: int):
+        """Refresh row i in place after its launcher was edited."""
+        row = self.listw.itemWidget(self.listw.item(i))
+        row.name_btn.setText(self.launches[i].get("name", "Untitled"))
+
+    def _remove_row(self, i: int):
+        """Drop row i; its widget is released with the item."""
+        self.listw.takeItem(i)
 
     # -----------------------------
     # CRUD ACTIONS
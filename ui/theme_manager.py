@@ -1,18 +1,29 @@
+import hashlib
 import json
 import os
+import time
 
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QCoreApplication, QObject, QTimer, pyqtSignal
 from PyQt6.QtGui import QColor, QPalette
 from PyQt6.QtWidgets import QApplication, QStyleFactory, QWidget
 
 import core.storage as storage
 from core.app_settings import APP_SETTINGS
+from core.utils import json_dumps, json_loads
 
 
 class ThemeManager(QObject):
     theme_changed = pyqtSignal(bool)
     _instance = None
     _cached_settings = None
+    _last_settings_mtime = None
+    _last_settings_digest = None  # digest of the bytes we last wrote
+    _last_settings_check = 0.0
+    _SETTINGS_RECHECK_SECS = 1.0  # external edits are picked up within this window
+    _save_timer = None
+    _cached_themes = None
+    _last_themes_mtime = None
+    _last_themes_check = 0.0
 
     # --- unified base directories ---
     APP_NAME = APP_SETTINGS["app_name"]
@@ -25,6 +36,19 @@ class ThemeManager(QObject):
     SETTINGS_FILE = os.path.join(SETTINGS_DIR, "settings.json")
     THEMES_FILE = os.path.join(SETTINGS_DIR, "themes.json")
     _LOCK_HANDLES = []
+    _theme_cache = {}  # colors -> (QPalette, stylesheet)
+
+    # Palette role -> themes.json key, resolved once at import
+    _PALETTE_ROLES = (
+        (QPalette.ColorRole.Window, "Window"),
+        (QPalette.ColorRole.Base, "Base"),
+        (QPalette.ColorRole.WindowText, "Text"),
+        (QPalette.ColorRole.Text, "Text"),
+        (QPalette.ColorRole.Button, "Button"),
+        (QPalette.ColorRole.ButtonText, "ButtonText"),
+        (QPalette.ColorRole.Highlight, "Hover"),
+    )
+    _fusion_applied = False
 
     DEFAULT_THEMES = {
         "dark": {
@@ -114,27 +138,38 @@ class ThemeManager(QObject):
     def ensure_default_themes():
         """If themes.json doesn’t exist, create it with defaults."""
         ThemeManager.ensure_appdir()
-        if not os.path.exists(ThemeManager.THEMES_FILE):
-            with open(ThemeManager.THEMES_FILE, "w", encoding="utf-8") as f:
-                json.dump(ThemeManager.DEFAULT_THEMES, f, indent=2)
+        try:
+            # "x" creates only if missing: one open instead of stat + open
+            with open(ThemeManager.THEMES_FILE, "xb") as f:
+                f.write(json_dumps(ThemeManager.DEFAULT_THEMES))
+        except FileExistsError:
+            pass
 
     @staticmethod
     def ensure_default_settings():
         """If settings.json doesn’t exist, create it with defaults."""
         ThemeManager.ensure_appdir()
-        if not os.path.exists(ThemeManager.SETTINGS_FILE):
-            with open(ThemeManager.SETTINGS_FILE, "w", encoding="utf-8") as f:
-                json.dump(ThemeManager.DEFAULT_SETTINGS, f, indent=2)
+        try:
+            with open(ThemeManager.SETTINGS_FILE, "xb") as f:
+                f.write(json_dumps(ThemeManager.DEFAULT_SETTINGS))
+        except FileExistsError:
+            pass
 
     # === Settings I/O ===
     @staticmethod
     def _load_settings() -> dict:
         """Load settings.json, auto-refresh if file changed on disk."""
         settings_file = ThemeManager.SETTINGS_FILE
-        ThemeManager.ensure_appdir()
 
-        # --- detect modification ---
-        last_mtime = getattr(ThemeManager, "_last_settings_mtime", None)
+        # --- serve from memory; stat the file at most once per recheck window ---
+        now = time.monotonic()
+        if (ThemeManager._cached_settings is not None
+                and now - ThemeManager._last_settings_check < ThemeManager._SETTINGS_RECHECK_SECS):
+            return ThemeManager._cached_settings
+        ThemeManager._last_settings_check = now
+
+        # --- detect modification (single stat, no directory checks) ---
+        last_mtime = ThemeManager._last_settings_mtime
         try:
             current_mtime = os.path.getmtime(settings_file)
         except FileNotFoundError:
@@ -143,8 +178,11 @@ class ThemeManager(QObject):
         # --- reload if cache empty or file changed ---
         if ThemeManager._cached_settings is None or current_mtime != last_mtime:
             try:
-                with open(settings_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                with open(settings_file, "rb") as f:
+                    data = json_loads(f.read())
+                # fill missing defaults in place, once per (re)load
+                for k, v in ThemeManager.DEFAULT_SETTINGS.items():
+                    data.setdefault(k, v)
                 ThemeManager._cached_settings = data
                 ThemeManager._last_settings_mtime = current_mtime
                 print(f"🔄 Reloaded settings.json (mtime changed).")
@@ -152,24 +190,64 @@ class ThemeManager(QObject):
                 print(f"⚠️ Failed to reload settings.json: {e}")
                 ThemeManager._cached_settings = ThemeManager.DEFAULT_SETTINGS.copy()
 
-        # fill missing defaults (safe)
-        for k, v in ThemeManager.DEFAULT_SETTINGS.items():
-            ThemeManager._cached_settings.setdefault(k, v)
-
         return ThemeManager._cached_settings
 
 
     @staticmethod
     def _save_settings(data: dict):
-        """Safely save settings only if the folder still exists."""
+        """
+        Update the cache now and schedule the disk write.
+        Rapid successive changes (e.g. a theme toggle) coalesce into one write;
+        pending changes are flushed when the application quits.
+        """
         ThemeManager._cached_settings = data
+        app = QCoreApplication.instance()
+        if app is None:
+            ThemeManager._write_settings()
+            return
+
+        if ThemeManager._save_timer is None:
+            timer = QTimer()
+            timer.setSingleShot(True)
+            timer.setInterval(300)
+            timer.timeout.connect(ThemeManager._write_settings)
+            app.aboutToQuit.connect(ThemeManager.flush_settings)
+            ThemeManager._save_timer = timer
+        ThemeManager._save_timer.start()
+
+    @staticmethod
+    def flush_settings():
+        """Write any pending settings change immediately."""
+        timer = ThemeManager._save_timer
+        if timer is not None and timer.isActive():
+            timer.stop()
+            ThemeManager._write_settings()
+
+    @staticmethod
+    def _write_settings():
+        """Safely save settings only if the folder still exists."""
+        data = ThemeManager._cached_settings
         base_dir = os.path.dirname(ThemeManager.SETTINGS_FILE)
         if not os.path.exists(base_dir):
             print("⚠️ Settings folder missing — skipping save to avoid unwanted recreation.")
             return
         try:
-            with open(ThemeManager.SETTINGS_FILE, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            data_bytes = json_dumps(data)
+            digest = hashlib.blake2b(data_bytes).digest()
+            # Skip no-op writes, unless the file was changed behind our back
+            if digest == ThemeManager._last_settings_digest:
+                try:
+                    if os.path.getmtime(ThemeManager.SETTINGS_FILE) == ThemeManager._last_settings_mtime:
+                        return
+                except FileNotFoundError:
+                    pass
+            # Written in place: lock_config_files() holds the file open, so no os.replace swap
+            with open(ThemeManager.SETTINGS_FILE, "wb") as f:
+                f.write(data_bytes)
+            # Write-through: the cache already holds `data`, so remember the
+            # new mtime to avoid re-parsing our own write on the next read.
+            ThemeManager._last_settings_mtime = os.path.getmtime(ThemeManager.SETTINGS_FILE)
+            ThemeManager._last_settings_digest = digest
         except Exception as e:
             print(f"⚠️ Failed to write settings.json: {e}")
 
@@ -187,14 +265,40 @@ class ThemeManager(QObject):
     # === Theme I/O ===
     @staticmethod
     def load_themes() -> dict:
-        """Load themes from AppData/themes.json; create defaults if missing."""
-        ThemeManager.ensure_default_themes()
+        """Load themes from AppData/themes.json; create defaults if missing.
+
+        The parsed dict is cached (shared, treat as read-only) and re-parsed only
+        when the file's mtime changes, checked at most once per recheck window.
+        """
+        now = time.monotonic()
+        if (ThemeManager._cached_themes is not None
+                and now - ThemeManager._last_themes_check < ThemeManager._SETTINGS_RECHECK_SECS):
+            return ThemeManager._cached_themes
+        ThemeManager._last_themes_check = now
+
         try:
-            with open(ThemeManager.THEMES_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"⚠️ Failed to load themes.json: {e}")
-            return ThemeManager.DEFAULT_THEMES.copy()
+            current_mtime = os.path.getmtime(ThemeManager.THEMES_FILE)
+        except FileNotFoundError:
+            ThemeManager.ensure_default_themes()
+            current_mtime = None
+
+        if ThemeManager._cached_themes is None or current_mtime != ThemeManager._last_themes_mtime:
+            try:
+                with open(ThemeManager.THEMES_FILE, "rb") as f:
+                    ThemeManager._cached_themes = json_loads(f.read())
+                ThemeManager._last_themes_mtime = current_mtime
+            except Exception as e:
+                print(f"⚠️ Failed to load themes.json: {e}")
+                ThemeManager._cached_themes = ThemeManager.DEFAULT_THEMES.copy()
+                ThemeManager._last_themes_mtime = None
+        return ThemeManager._cached_themes
+
+    @staticmethod
+    def colors(dark: bool = None) -> dict:
+        """Return the color set for the given (default: current) theme."""
+        if dark is None:
+            dark = ThemeManager.is_dark()
+        return ThemeManager.load_themes()["dark" if dark else "light"]
 
     @staticmethod
     def is_dark() -> bool:
@@ -213,26 +317,25 @@ class ThemeManager(QObject):
 
     # === Core application logic ===
     @staticmethod
-    def apply(app: QApplication, dark: bool):
-        """Apply theme dynamically."""
-        app.setStyle(QStyleFactory.create("Fusion"))
+    def _compiled_theme(colors: dict):
+        """Return (QPalette, stylesheet) for a color set, building each only once."""
+        key = tuple(sorted(colors.items()))
+        cached = ThemeManager._theme_cache.get(key)
+        if cached is not None:
+            return cached
+
         palette = QPalette()
 
-        all_themes = ThemeManager.load_themes()
-        colors = all_themes["dark" if dark else "light"]
-
-        # Apply palette roles
-        palette.setColor(QPalette.ColorRole.Window, QColor(colors["Window"]))
-        palette.setColor(QPalette.ColorRole.Base, QColor(colors["Base"]))
-        palette.setColor(QPalette.ColorRole.WindowText, QColor(colors["Text"]))
-        palette.setColor(QPalette.ColorRole.Text, QColor(colors["Text"]))
-        palette.setColor(QPalette.ColorRole.Button, QColor(colors["Button"]))
-        palette.setColor(QPalette.ColorRole.ButtonText, QColor(colors["ButtonText"]))
-        palette.setColor(QPalette.ColorRole.Highlight, QColor(colors["Hover"]))
-        app.setPalette(palette)
+        # Apply palette roles (one QColor per distinct theme key)
+        qcolors = {}
+        for role, key in ThemeManager._PALETTE_ROLES:
+            color = qcolors.get(key)
+            if color is None:
+                color = qcolors[key] = QColor(colors[key])
+            palette.setColor(role, color)
 
         # Global stylesheet
-        app.setStyleSheet(f"""
+        stylesheet = f"""
             * {{
                 font-size: 14px;
                 font-family: 'Segoe UI';
@@ -264,7 +367,25 @@ class ThemeManager(QObject):
             QPushButton:hover {{
                 background-color: {colors["Hover"]};
             }}
-        """)
+        """
+
+        cached = ThemeManager._theme_cache[key] = (palette, stylesheet)
+        return cached
+
+    @staticmethod
+    def apply(app: QApplication, dark: bool):
+        """Apply theme dynamically."""
+        # Switching style re-polishes every widget, so only do it once
+        if not ThemeManager._fusion_applied:
+            app.setStyle(QStyleFactory.create("Fusion"))
+            ThemeManager._fusion_applied = True
+
+        colors = ThemeManager.colors(dark)
+        palette, stylesheet = ThemeManager._compiled_theme(colors)
+
+        app.setPalette(palette)
+        if app.styleSheet() != stylesheet:
+            app.setStyleSheet(stylesheet)
 
         # Force refresh
         for top in app.topLevelWidgets():
@@ -272,7 +393,6 @@ class ThemeManager(QObject):
                 child.setPalette(palette)
             top.setPalette(palette)
             top.update()
-            top.repaint()
 
     @staticmethod
     def apply_theme(theme: str):
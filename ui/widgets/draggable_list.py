@@ -1,4 +1,4 @@
-from PyQt6.QtCore import QPoint, QSize, Qt
+from PyQt6.QtCore import QPoint, QSize, Qt, pyqtSignal
 from PyQt6.QtWidgets import QFrame, QListWidget, QListWidgetItem
 
 
@@ -8,8 +8,12 @@ class DraggableList(QListWidget):
     - NO list mutations while mouse is down
     - NO widget detaches/deletes until mouse release
     - Uses a lightweight overlay ghost (no grab())
+
+    Emits rowMoved(src, dst) after a row was dropped at a new position.
     """
 
+    rowMoved = pyqtSignal(int, int)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.setSpacing(4)
@@ -20,7 +24,7 @@ class DraggableList(QListWidget):
         self._press_pos = QPoint()
         self._start_row = -1
         self._target_row = -1
-        self._ghost = None          # QFrame overlay
+        self._ghost = None          # QFrame overlay, created on first drag and reused
         self._ghost_height = 0
 
     # ---------- Mouse handlers ----------
@@ -45,7 +49,7 @@ class DraggableList(QListWidget):
             self._begin_drag_visuals()
             self._dragging = True
 
-        if not self._ghost:
+        if not self._ghost or self._ghost.isHidden():
             return
 
         # move ghost vertically within viewport
@@ -80,22 +84,23 @@ class DraggableList(QListWidget):
             return
         rect = self.visualItemRect(it)
 
-        # Lightweight ghost: no QWidget.grab()
-        self._ghost = QFrame(self.viewport())
+        # Lightweight ghost: no QWidget.grab(); built (and its sheet parsed) once, then reused
+        if self._ghost is None:
+            self._ghost = QFrame(self.viewport())
+            self._ghost.setStyleSheet(
+                "background: rgba(100,150,255,0.15); "
+                "border: 1px dashed rgba(100,150,255,0.6); "
+                "border-radius: 6px;"
+            )
         self._ghost.setGeometry(rect)
         self._ghost_height = rect.height()
-        self._ghost.setStyleSheet(
-            "background: rgba(100,150,255,0.15); "
-            "border: 1px dashed rgba(100,150,255,0.6); "
-            "border-radius: 6px;"
-        )
         self._ghost.show()
+        self._ghost.raise_()
 
     def _end_drag_visuals(self):
-        if self._ghost:
-            self._ghost.deleteLater()
-            self._ghost = None
-        self.viewport().update()
+        if self._ghost and not self._ghost.isHidden():
+            self._ghost.hide()
+            self.viewport().update()
 
     def _finish_reorder(self):
         """Reorder items by cloning data instead of moving widgets."""
@@ -133,7 +138,8 @@ class DraggableList(QListWidget):
         self.insertItem(dst, new_item)
         self.setItemWidget(new_item, new_widget)
 
-        # Refresh UI
+        # Refresh UI (queued; paints once on the next event-loop pass)
         self.viewport().update()
         self.updateGeometry()
-        self.repaint()
+
+        self.rowMoved.emit(src, dst)
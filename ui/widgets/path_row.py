@@ -1,7 +1,6 @@
 # ui/widgets/path_row.py
 from typing import Any, Dict
 
-from PyQt6 import sip
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import (QDoubleSpinBox, QFileDialog, QHBoxLayout, QLabel,
                              QLineEdit, QPushButton, QSizePolicy, QWidget)
@@ -19,8 +18,11 @@ class PathRow(QWidget):
     def __init__(self, path: str = "", delay: float = None, mode: str = None):
         super().__init__()
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Maximum)
+        # Selection highlight comes from the editor's sheet: QWidget#pathRow[selected="true"]
+        self.setObjectName("pathRow")
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         # Give each row a subtle background for visibility
-        colors = ThemeManager.load_themes()["dark" if ThemeManager.is_dark() else "light"]
+        colors = ThemeManager.colors()
         base = colors["Base"]
         alt = colors["Window"]  # usually slightly lighter/darker
         self.setStyleSheet("border-radius: 8px;")
@@ -108,30 +110,13 @@ class PathRow(QWidget):
         # --- Behavior ---
         self.browse_btn.clicked.connect(self._pick)
 
-        if hasattr(ThemeManager, "instance"):
-            def _is_alive(widget):
-                try:
-                    return widget is not None and not sip.isdeleted(widget)
-                except Exception:
-                    return False
+        # Buttons restyled on theme change; the owning LaunchEditor drives this
+        # from its single debounced refresh instead of one connection per row
+        self._themed_buttons = (self.browse_btn, self.delete_btn)
 
-            def _safe_refresh(_=None):
-                # Prevent invalid access after destruction
-                if not _is_alive(self):
-                    return
-                if _is_alive(self.browse_btn):
-                    apply_button_style(self.browse_btn)
-                if _is_alive(self.delete_btn):
-                    apply_button_style(self.delete_btn)
-                if _is_alive(self.mode):
-                    apply_combobox_style(self.mode)
-
-        ThemeManager.instance().theme_changed.connect(_safe_refresh)
-
-
-    def _refresh_button_styles(self):
+    def refresh_button_styles(self):
         """Reapply button colors when theme toggles."""
-        for btn in (self.browse_btn, self.delete_btn):
+        for btn in self._themed_buttons:
             apply_button_style(btn)
 
     def refresh_icons(self, is_dark: bool):
@@ -150,9 +135,14 @@ class PathRow(QWidget):
         if f:
             self.path_edit.setText(f)
 
+    @property
+    def path(self) -> str:
+        """The entered path, stripped (same as value()["path"])."""
+        return self.path_edit.text().strip()
+
     def value(self) -> Dict[str, Any]:
         return {
-            "path": self.path_edit.text().strip(),
+            "path": self.path,
             "delay": float(self.delay.value()),
             "start_option": self.mode.currentText(),
         }
@@ -1,79 +1,98 @@
 # ui/widgets/style_helpers.py
 import os
+import sys
 
+from PyQt6 import sip
 from PyQt6.QtWidgets import (QComboBox, QDoubleSpinBox, QFrame, QLabel,
                              QLineEdit, QListWidget, QPushButton, QWidget)
 
 from ui.theme_manager import ThemeManager
 
+# --- Stylesheet templates: filled from the theme colors dict via format_map ---
+# Sheets are interned, so every widget styled for the same theme hands Qt the
+# same string object instead of a freshly formatted copy.
+_BUTTON_QSS = """
+    QPushButton {{
+        border: 1px solid {Border};
+        border-radius: 6px;
+        background-color: {Button};
+        color: {ButtonText};
+        padding: 4px;
+    }}
+    QPushButton:hover {{
+        background-color: {Hover};
+    }}
+"""
+
+_INPUT_QSS = """
+    QLineEdit {{
+        background-color: {Base};
+        border: 1px solid {Border};
+        border-radius: 6px;
+        padding: 6px 8px;
+        color: {Text};
+        selection-background-color: {Hover};
+        selection-color: {SelectionText};
+        font-size: 13px;
+    }}
+    QLineEdit:hover {{
+        border: 1px solid {Hover};
+    }}
+    QLineEdit:focus {{
+        border: 1px solid {Hover};
+        background-color: {Base};
+    }}
+"""
+
+_FRAME_QSS = """
+    QFrame#{name} {{
+        border: 1px solid {Border};
+        border-radius: 8px;
+        background-color: {Base};
+        margin-top: 4px;
+    }}
+    QFrame#{name}:hover {{
+        border: 1px solid {Hover};
+    }}
+"""
+
+_TOOLTIP_QSS = """
+    QToolTip {{
+        background-color: {Hover};
+        color: {Text};
+        border: 1px solid {Border};
+        border-radius: 6px;
+        padding: 4px 8px;
+    }}
+"""
+
 
 def apply_button_style(btn: QPushButton) -> None:
         """Apply a consistent border, radius, and hover color to PathRow buttons."""
-        colors = ThemeManager.load_themes()["dark" if ThemeManager.is_dark() else "light"]
-        border = colors["Border"]
-        hover = colors["Hover"]
-        base = colors["Button"]
-        text = colors["ButtonText"]
-
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                border: 1px solid {border};
-                border-radius: 6px;
-                background-color: {base};
-                color: {text};
-                padding: 4px;
-            }}
-            QPushButton:hover {{
-                background-color: {hover};
-            }}
-        """)
+        btn.setStyleSheet(sys.intern(_BUTTON_QSS.format_map(ThemeManager.colors())))
 
 def apply_input_style(input_field: QLineEdit) -> None:
     """Modern, theme-aware flat QLineEdit with readable selection."""
-    colors = ThemeManager.load_themes()["dark" if ThemeManager.is_dark() else "light"]
-    base = colors["Base"]
-    hover = colors["Hover"]
-    border = colors["Border"]
-    text = colors["Text"]
-
+    dark = ThemeManager.is_dark()
     # Use contrasting text for selection depending on theme
-    selection_bg = hover
-    selection_text = "#ffffff" if ThemeManager.is_dark() else "#000000"
-
-    input_field.setStyleSheet(f"""
-        QLineEdit {{
-            background-color: {base};
-            border: 1px solid {border};
-            border-radius: 6px;
-            padding: 6px 8px;
-            color: {text};
-            selection-background-color: {selection_bg};
-            selection-color: {selection_text};
-            font-size: 13px;
-        }}
-        QLineEdit:hover {{
-            border: 1px solid {hover};
-        }}
-        QLineEdit:focus {{
-            border: 1px solid {hover};
-            background-color: {base};
-        }}
-    """)
+    colors = dict(ThemeManager.colors(dark), SelectionText="#ffffff" if dark else "#000000")
+    input_field.setStyleSheet(sys.intern(_INPUT_QSS.format_map(colors)))
 
 def apply_spinbox_style(spinbox: QDoubleSpinBox) -> None:
     """Modern, flat QDoubleSpinBox styled to match theme with readable selection."""
-    colors = ThemeManager.load_themes()["dark" if ThemeManager.is_dark() else "light"]
+    dark = ThemeManager.is_dark()
+    colors = ThemeManager.colors(dark)
     base = colors["Base"]
     hover = colors["Hover"]
     border = colors["Border"]
     text = colors["Text"]
 
-    theme_dir = "dark" if ThemeManager.is_dark() else "light"
+    theme_dir = "dark" if dark else "light"
     arrow_up = os.path.join("resources", "icons", f"{theme_dir} icons", "spin_up.svg").replace("\\", "/")
     arrow_down = os.path.join("resources", "icons", f"{theme_dir} icons", "spin_down.svg").replace("\\", "/")
 
     selection_bg = hover
-    selection_text = "#ffffff" if ThemeManager.is_dark() else "#000000"
+    selection_text = "#ffffff" if dark else "#000000"
 
     spinbox.setStyleSheet(f"""
         QDoubleSpinBox {{
@@ -126,14 +145,15 @@ def apply_spinbox_style(spinbox: QDoubleSpinBox) -> None:
 
 def apply_combobox_style(combo: QComboBox) -> None:
     """Unified modern combo style that auto-refreshes on theme change."""
-    colors = ThemeManager.load_themes()["dark" if ThemeManager.is_dark() else "light"]
+    dark = ThemeManager.is_dark()
+    colors = ThemeManager.colors(dark)
     base = colors["Base"]
     hover = colors["Hover"]
     border = colors["Border"]
     text = colors["Text"]
     window = colors["Window"]
 
-    theme_dir = "dark" if ThemeManager.is_dark() else "light"
+    theme_dir = "dark" if dark else "light"
     arrow_down = os.path.join("resources", "icons", f"{theme_dir} icons", "spin_down.svg").replace("\\", "/")
 
     combo.setStyleSheet(f"""
@@ -181,30 +201,25 @@ def apply_combobox_style(combo: QComboBox) -> None:
         }}
     """)
 
-    # Ensure it updates live on theme change
-    if hasattr(ThemeManager, "instance"):
-        ThemeManager.instance().theme_changed.connect(lambda _: apply_combobox_style(combo))
+    # Ensure it updates live on theme change (hook once per combo, not per restyle)
+    if not getattr(combo, "_theme_hooked", False):
+        combo._theme_hooked = True
+
+        def _refresh(_):
+            if not sip.isdeleted(combo):
+                apply_combobox_style(combo)
+
+        ThemeManager.instance().theme_changed.connect(_refresh)
 
 
 def apply_frame_style(frame: QFrame, object_name: str) -> None:
     """Apply consistent bordered background to frame containers."""
-    colors = ThemeManager.load_themes()["dark" if ThemeManager.is_dark() else "light"]
-    border, base, hover = colors["Border"], colors["Base"], colors["Hover"]
-    frame.setStyleSheet(f"""
-        QFrame#{object_name} {{
-            border: 1px solid {border};
-            border-radius: 8px;
-            background-color: {base};
-            margin-top: 4px;
-        }}
-        QFrame#{object_name}:hover {{
-            border: 1px solid {hover};
-        }}
-    """)
+    colors = dict(ThemeManager.colors(), name=object_name)
+    frame.setStyleSheet(sys.intern(_FRAME_QSS.format_map(colors)))
 
 def apply_label_style(label: QLabel, bold=False, underline=False, size=14) -> None:
     """Apply theme-synced label text style."""
-    colors = ThemeManager.load_themes()["dark" if ThemeManager.is_dark() else "light"]
+    colors = ThemeManager.colors()
     style = f"color: {colors['Text']}; font-size:{size}px;"
     if bold:
         style += " font-weight:600;"
@@ -214,21 +229,8 @@ def apply_label_style(label: QLabel, bold=False, underline=False, size=14) -> No
     
 def apply_tooltip_style(widget: QWidget) -> None:
     """Apply consistent theme-aware tooltip styling globally on a widget or window."""
-    colors = ThemeManager.load_themes()["dark" if ThemeManager.is_dark() else "light"]
-    bg = colors["Hover"]
-    text = colors["Text"]
-    border = colors["Border"]
-
     # Append QToolTip styling to the widget’s existing stylesheet
-    widget.setStyleSheet(widget.styleSheet() + f"""
-        QToolTip {{
-            background-color: {bg};
-            color: {text};
-            border: 1px solid {border};
-            border-radius: 6px;
-            padding: 4px 8px;
-        }}
-    """)
+    widget.setStyleSheet(widget.styleSheet() + _TOOLTIP_QSS.format_map(ThemeManager.colors()))
 
 def apply_list_style(list_widget: QListWidget) -> None:
     """Remove QListWidget's default black border without affecting children."""
@@ -237,7 +239,7 @@ def apply_list_style(list_widget: QListWidget) -> None:
     
 def apply_titlebar_style(titlebar: QWidget) -> None:
     """Apply theme-aware, VSCode-style look to the custom title bar."""
-    colors = ThemeManager.load_themes()["dark" if ThemeManager.is_dark() else "light"]
+    colors = ThemeManager.colors()
     bg = colors["Base"]
     border = colors["Border"]
     text = colors["Text"]
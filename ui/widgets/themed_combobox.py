@@ -25,7 +25,7 @@ class ThemedComboBox(QComboBox):
 
     def _apply_theme_colors(self):
         """Applies ThemeManager colors directly to popup palette (ensures consistency)."""
-        colors = ThemeManager.load_themes()["dark" if ThemeManager.is_dark() else "light"]
+        colors = ThemeManager.colors()
 
         base = QColor(colors["Base"])
         text = QColor(colors["Text"])
@@ -40,10 +40,11 @@ class ThemedComboBox(QComboBox):
         pal.setColor(QPalette.ColorRole.Highlight, highlight)
         pal.setColor(QPalette.ColorRole.HighlightedText, text)
         self.setPalette(pal)
+        return colors
 
     def showPopup(self):
         """Ensure popup adopts theme palette and aligns perfectly with combo field."""
-        self._apply_theme_colors()
+        colors = self._apply_theme_colors()
         view = self.view()
         popup = view.window()
 
@@ -60,7 +61,6 @@ class ThemedComboBox(QComboBox):
         view.setFrameShape(QFrame.Shape.NoFrame)
 
         # --- Theme colors ---
-        colors = ThemeManager.load_themes()["dark" if ThemeManager.is_dark() else "light"]
         border = colors["Border"]
         bg = colors["Base"]
         hover = colors["Hover"]
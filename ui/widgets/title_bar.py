@@ -1,4 +1,6 @@
 # ui/widgets/title_bar.py
+from functools import lru_cache
+
 from PyQt6.QtCore import QEasingCurve, QPoint, QPropertyAnimation, QSize, Qt
 from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import (QGraphicsOpacityEffect, QHBoxLayout, QLabel,
@@ -8,6 +10,33 @@ from ui.icon_loader import themed_icon
 from ui.theme_manager import ThemeManager
 from ui.widgets.style_helpers import apply_titlebar_style
 
+# --- Win32 constants for the native frame animations ---
+GWL_STYLE = -16
+WS_CAPTION = 0x00C00000
+WS_THICKFRAME = 0x00040000
+WS_MAXIMIZE = 0x01000000
+WM_SYSCOMMAND = 0x0112
+SC_MINIMIZE = 0xF020
+SC_MAXIMIZE = 0xF030
+SC_RESTORE = 0xF120
+SC_CLOSE = 0xF060
+
+
+@lru_cache(maxsize=1)
+def _user32():
+    """Private user32 handle with the calls we use resolved once and typed."""
+    import ctypes
+    from ctypes import wintypes
+
+    user32 = ctypes.WinDLL("user32")  # raises off Windows -> callers fall back to Qt
+    user32.GetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int]
+    user32.GetWindowLongW.restype = wintypes.LONG
+    user32.SetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int, wintypes.LONG]
+    user32.SetWindowLongW.restype = wintypes.LONG
+    user32.PostMessageW.argtypes = [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+    user32.PostMessageW.restype = wintypes.BOOL
+    return user32
+
 
 class TitleBar(QWidget):
     """VS Code–style title bar with icon, menu, and window buttons."""
@@ -113,18 +142,7 @@ class TitleBar(QWidget):
     def _toggle_maximize(self):
         """Trigger Windows-native maximize/restore animations with full state sync."""
         try:
-            import ctypes
-            from ctypes import wintypes
-
-            user32 = ctypes.windll.user32
-            GWL_STYLE = -16
-            WS_CAPTION = 0x00C00000
-            WS_THICKFRAME = 0x00040000
-            WS_MAXIMIZE = 0x01000000
-            WM_SYSCOMMAND = 0x0112
-            SC_MAXIMIZE = 0xF030
-            SC_RESTORE = 0xF120
-
+            user32 = _user32()
             hwnd = int(self._root.winId())
 
             # Read current window style to determine real state
@@ -175,16 +193,7 @@ class TitleBar(QWidget):
     def _animate_minimize(self):
         """Temporarily restore WS_CAPTION so Windows plays its native animation."""
         try:
-            import ctypes
-            from ctypes import wintypes
-
-            user32 = ctypes.windll.user32
-            GWL_STYLE = -16
-            WS_CAPTION = 0x00C00000
-            WS_THICKFRAME = 0x00040000
-            WM_SYSCOMMAND = 0x0112
-            SC_MINIMIZE = 0xF020
-
+            user32 = _user32()
             hwnd = int(self._root.winId())
 
             # 1️⃣  Add normal window styles so DWM can animate
@@ -230,16 +239,7 @@ class TitleBar(QWidget):
     def _animate_close(self):
         """Trigger Windows-native close animation using SC_CLOSE."""
         try:
-            import ctypes
-            from ctypes import wintypes
-
-            user32 = ctypes.windll.user32
-            GWL_STYLE = -16
-            WS_CAPTION = 0x00C00000
-            WS_THICKFRAME = 0x00040000
-            WM_SYSCOMMAND = 0x0112
-            SC_CLOSE = 0xF060
-
+            user32 = _user32()
             hwnd = int(self._root.winId())
 
             # Restore normal window style so DWM owns it for animation
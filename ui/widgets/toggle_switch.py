@@ -32,6 +32,18 @@ class ToggleSwitch(QPushButton):
         self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.setStyleSheet("border: none; background: transparent;")
 
+    def set_state(self, checked: bool):
+        """Jump to a state without animating (e.g. when re-syncing to saved settings)."""
+        if checked == self.isChecked():
+            return
+        self.setChecked(checked)
+        self._handle_position = 1 if checked else 0
+        self._bg_color = QColor("#0f2027") if checked else QColor("#cfcfcf")
+        self._icon_opacity = 1.0 if checked else 0.0
+        self._rotation = 360.0 if checked else 0.0
+        self._blend = 1.0 if checked else 0.0
+        self.update()
+
     # === Properties for animation ===
     def get_handle_pos(self): return self._handle_position
     def set_handle_pos(self, pos): self._handle_position = pos; self.update()